@@ -0,0 +1,119 @@
+import heapq
+import math
+
+from ..compat import np
+from .dijkstra import INF, query_rows, reconstruct
+
+
+# A heuristic is a factory ``heuristic(csr, target) -> h`` where ``h(i)``
+# returns a lower bound on the cost from CSR row i to row ``target``.
+# It must never overestimate, or A* may return a longer path.
+
+def zero_heuristic(csr, target):
+    """h = 0: A* degrades to Dijkstra."""
+    return lambda i: 0.0
+
+
+def cost_scale(csr):
+    """
+    Largest alpha <= 1 with cost(i, j) >= alpha * (1 + |x_i - x_j|^2) on
+    every edge, x being the (aktiflik, etkilesim, baglanti_sayisi) vector.
+    For weights from Graph.calculate_weight alpha is 1; for any other
+    stored weights it shrinks so the bound still holds. Cached on the CSR.
+    """
+    alpha = getattr(csr, "_astar_scale", None)
+    if alpha is not None:
+        return alpha
+
+    if np is not None and len(csr.neighbors) > 0:
+        offsets = np.asarray(csr.offsets, dtype=np.int64)
+        rows = np.repeat(np.arange(len(csr.ids)), np.diff(offsets))
+        cols = np.asarray(csr.neighbors, dtype=np.int64)
+        sq = np.zeros(len(cols))
+        for column in (csr.aktiflik, csr.etkilesim, csr.baglanti_sayisi):
+            x = np.asarray(column, dtype=np.float64)
+            sq += (x[rows] - x[cols]) ** 2
+        alpha = float(min(1.0, np.min(np.asarray(csr.costs) / (1 + sq))))
+    else:
+        alpha = 1.0
+        columns = (csr.aktiflik, csr.etkilesim, csr.baglanti_sayisi)
+        offsets, neighbors, costs = csr.offsets, csr.neighbors, csr.costs
+        for i in range(len(csr.ids)):
+            for k in range(offsets[i], offsets[i + 1]):
+                j = neighbors[k]
+                sq = sum((c[i] - c[j]) ** 2 for c in columns)
+                alpha = min(alpha, costs[k] / (1 + sq))
+
+    csr._astar_scale = alpha
+    return alpha
+
+
+def attribute_heuristic(csr, target):
+    """
+    Admissible default derived from the edge cost 1 / w = 1 + |Δx|^2.
+
+    A path of k >= 1 edges covering an attribute distance d = |x_i - x_t|
+    costs at least k + d^2 / k (Cauchy-Schwarz), whose minimum over k is
+    1 + d^2 for d <= 1 and 2d otherwise. Scaling by cost_scale() keeps the
+    bound valid for arbitrary stored weights. The function is also
+    consistent, so a node never needs to be expanded twice.
+    """
+    alpha = cost_scale(csr)
+    akt, etk, bag = csr.aktiflik, csr.etkilesim, csr.baglanti_sayisi
+    t_akt, t_etk, t_bag = akt[target], etk[target], bag[target]
+
+    def h(i):
+        if i == target:
+            return 0.0
+        sq = (akt[i] - t_akt) ** 2 + (etk[i] - t_etk) ** 2 + (bag[i] - t_bag) ** 2
+        return alpha * (1 + sq if sq <= 1 else 2 * math.sqrt(sq))
+
+    return h
+
+
+def search(csr, start, target, heuristic=None):
+    """
+    A* over CSR row indices with a binary heap, a closed set and
+    decrease-key by reinsertion (stale heap entries are skipped).
+    Returns (g, previous, expanded).
+    """
+    h = (heuristic or attribute_heuristic)(csr, target)
+    offsets, neighbors, costs = csr.offsets, csr.neighbors, csr.costs
+
+    g = {start: 0}
+    previous = {start: -1}
+    closed = set()
+    heap = [(h(start), start)]
+    expanded = 0
+
+    while heap:
+        _, i = heapq.heappop(heap)
+        if i in closed:
+            continue
+        if i == target:
+            break
+        closed.add(i)
+        expanded += 1
+
+        gi = g[i]
+        for k in range(offsets[i], offsets[i + 1]):
+            j = neighbors[k]
+            tentative_g = gi + costs[k]
+            if tentative_g < g.get(j, INF):
+                g[j] = tentative_g
+                previous[j] = i
+                # Only an inconsistent custom heuristic can reopen a node.
+                closed.discard(j)
+                heapq.heappush(heap, (tentative_g + h(j), j))
+
+    return g, previous, expanded
+
+
+class AStar:
+    @staticmethod
+    def run(graph, start_id, end_id, heuristic=None):
+        """Shortest (path, cost) between two nodes of a Graph or CSRGraph."""
+        csr, start, end = query_rows(graph, start_id, end_id)
+
+        g, previous, _ = search(csr, start, end, heuristic)
+        return reconstruct(csr, start, end, previous), g[end]
@@ -0,0 +1,189 @@
+import os
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+from ..compat import np
+from .dijkstra import INF, shortest_paths
+
+FLOYD_WARSHALL = "floyd_warshall"
+DIJKSTRA = "dijkstra"
+
+# Floyd-Warshall is O(n^3) but each of its n steps is one vectorised
+# n x n update, which beats n Python-level heap searches (even spread
+# over a few cores) up to here.
+FLOYD_MAX_NODES = 1000
+# Fewer sources than this are not worth starting worker processes for.
+POOL_MIN_SOURCES = 64
+# Matrices above this size live in a memory-mapped temporary file.
+MEMMAP_BYTES = 256 * 1024 * 1024
+
+
+def choose_method(n, full=True):
+    """Floyd-Warshall for full matrices of small graphs (numpy only), else Dijkstra."""
+    if np is not None and full and n <= FLOYD_MAX_NODES:
+        return FLOYD_WARSHALL
+    return DIJKSTRA
+
+
+def _allocate(rows, n, path=None):
+    """float32 rows x n matrix filled with INF; memory-mapped when large or when path is given."""
+    if path is not None:
+        matrix = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(rows, n))
+    elif rows * n * 4 > MEMMAP_BYTES:
+        # Anonymous temp file: the mapping keeps it alive, the OS deletes it.
+        matrix = np.memmap(tempfile.TemporaryFile(), dtype=np.float32, mode="w+", shape=(rows, n))
+    else:
+        return np.full((rows, n), np.inf, dtype=np.float32)
+    matrix[:] = np.inf
+    return matrix
+
+
+def floyd_warshall(csr, path=None):
+    """Vectorised Floyd-Warshall over csr.costs; needs numpy."""
+    n = len(csr.ids)
+    dist = _allocate(n, n, path)
+    offsets = np.asarray(csr.offsets, dtype=np.int64)
+    rows = np.repeat(np.arange(n), np.diff(offsets))
+    cols = np.asarray(csr.neighbors, dtype=np.int64)
+    np.minimum.at(dist, (rows, cols), np.asarray(csr.costs, dtype=np.float32))
+    np.fill_diagonal(dist, 0)
+
+    # Row k and column k do not change during step k (dist[k, k] = 0),
+    # so the update can be done in place.
+    for k in range(n):
+        np.minimum(dist, dist[:, k, None] + dist[k], out=dist)
+    return dist
+
+
+# Worker process state, set once per process by _init_worker so the
+# adjacency is pickled per worker instead of per task.
+_shared = None
+
+
+def _init_worker(offsets, neighbors, costs):
+    global _shared
+    _shared = SimpleNamespace(offsets=offsets, neighbors=neighbors, costs=costs)
+
+
+def _distance_row(csr, n, source):
+    dist, _ = shortest_paths(csr, source)
+    row = array("f", [INF]) * n
+    for i, d in dist.items():
+        row[i] = d
+    return row
+
+
+def _worker_rows(task):
+    n, sources = task
+    return [_distance_row(_shared, n, s).tobytes() for s in sources]
+
+
+def dijkstra_rows(csr, sources, workers=None, path=None):
+    """
+    One heap Dijkstra per source row, fanned out over a process pool
+    (``workers`` processes, default os.cpu_count()) for large batches.
+    Returns a float32 len(sources) x n matrix, or a list of array('f')
+    rows without numpy.
+    """
+    n = len(csr.ids)
+    workers = workers or os.cpu_count() or 1
+
+    if np is not None:
+        matrix = _allocate(len(sources), n, path)
+    else:
+        matrix = [None] * len(sources)
+
+    def store(k, raw):
+        if np is not None:
+            matrix[k] = np.frombuffer(raw, dtype=np.float32)
+        else:
+            matrix[k] = array("f", raw)
+
+    if workers == 1 or len(sources) < POOL_MIN_SOURCES:
+        for k, s in enumerate(sources):
+            store(k, _distance_row(csr, n, s).tobytes())
+        return matrix
+
+    # Plain arrays: the CSR may hold memoryviews over a mapped file.
+    init = (array("q", csr.offsets), array("q", csr.neighbors), array("d", csr.costs))
+    chunk = max(1, len(sources) // (workers * 4))
+    tasks = [(n, sources[k:k + chunk]) for k in range(0, len(sources), chunk)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init) as pool:
+        k = 0
+        for rows in pool.map(_worker_rows, tasks):
+            for raw in rows:
+                store(k, raw)
+                k += 1
+    return matrix
+
+
+class DistanceMatrix:
+    """
+    Shortest-path costs from ``sources`` (node ids, all nodes by default)
+    to every node of a CSR snapshot. ``matrix[i][j]`` is the float32 cost
+    from the i-th source to CSR row j, inf when unreachable.
+    """
+
+    def __init__(self, csr, matrix, sources, version=None, method=None):
+        self.csr = csr
+        self.matrix = matrix
+        self.sources = sources
+        self.version = version
+        self.method = method
+        self._source_row = {nid: k for k, nid in enumerate(sources)}
+
+    @classmethod
+    def compute(cls, csr, sources=None, method=None, workers=None, path=None, version=None):
+        """
+        ``method`` is FLOYD_WARSHALL or DIJKSTRA; by default Floyd-Warshall
+        is used for full matrices of small graphs when numpy is available.
+        ``path`` writes the matrix to a .npy file (memory-mapped).
+        """
+        if sources is None:
+            rows = list(range(len(csr.ids)))
+            sources = list(csr.ids)
+        else:
+            rows = [csr.index(nid) for nid in sources]
+            sources = list(sources)
+
+        method = method or choose_method(len(csr.ids), len(rows) == len(csr.ids))
+        if method == FLOYD_WARSHALL:
+            if np is None:
+                raise RuntimeError("Floyd-Warshall için numpy gerekli")
+            matrix = floyd_warshall(csr, path)
+            if len(rows) != len(csr.ids):
+                matrix = matrix[rows]
+        elif method == DIJKSTRA:
+            matrix = dijkstra_rows(csr, rows, workers, path)
+        else:
+            raise ValueError(f"Bilinmeyen yöntem: {method}")
+        return cls(csr, matrix, sources, version, method)
+
+    def covers(self, sources):
+        return all(nid in self._source_row for nid in sources)
+
+    def row(self, node_id):
+        k = self._source_row.get(node_id)
+        if k is None:
+            raise ValueError("Node bulunamadı")
+        return self.matrix[k]
+
+    def distance(self, start_id, end_id):
+        j = self.csr.index(end_id, "Başlangıç veya hedef node bulunamadı")
+        return float(self.row(start_id)[j])
+
+    def distances(self, node_id):
+        """{node id: cost} for every node reachable from node_id."""
+        ids = self.csr.ids
+        return {ids[j]: float(d) for j, d in enumerate(self.row(node_id)) if d != INF}
+
+    def closeness(self, node_id):
+        """(V - 1) / sum of distances to the reachable nodes, 0 if isolated."""
+        row = self.row(node_id)
+        if np is not None and not isinstance(row, array):
+            total = float(row[np.isfinite(row)].sum(dtype=np.float64))
+        else:
+            total = sum(d for d in row if d != INF)
+        return (len(self.csr.ids) - 1) / total if total > 0 else 0
@@ -0,0 +1,155 @@
+import heapq
+
+INF = float("inf")
+
+
+def as_csr(graph):
+    """The compiled CSR snapshot of a Graph; a CSRGraph is returned as is."""
+    return graph.compile() if hasattr(graph, "compile") else graph
+
+
+def query_rows(graph, start_id, end_id):
+    """(csr, start row, end row) for a path query on a Graph or CSRGraph."""
+    csr = as_csr(graph)
+    msg = "Başlangıç veya hedef node bulunamadı"
+    return csr, csr.index(start_id, msg), csr.index(end_id, msg)
+
+
+def shortest_paths(csr, start, target=None):
+    """
+    Binary-heap Dijkstra with lazy deletion over a CSRGraph.
+
+    ``start``/``target`` are CSR row indices and edge costs come from the
+    precomputed ``csr.costs`` array. Returns ``(dist, previous)`` dicts
+    holding only the nodes that were reached, so a query never pays for
+    the size of the whole graph. With a target the search stops as soon
+    as the target is settled; other entries may then be upper bounds.
+    """
+    offsets, neighbors, costs = csr.offsets, csr.neighbors, csr.costs
+
+    dist = {start: 0}
+    previous = {start: -1}
+    heap = [(0, start)]
+
+    while heap:
+        d, i = heapq.heappop(heap)
+        if d > dist[i]:
+            continue  # stale entry, a shorter one was pushed later
+        if i == target:
+            break
+        for k in range(offsets[i], offsets[i + 1]):
+            j = neighbors[k]
+            nd = d + costs[k]
+            if nd < dist.get(j, INF):
+                dist[j] = nd
+                previous[j] = i
+                heapq.heappush(heap, (nd, j))
+
+    return dist, previous
+
+
+def bidirectional(csr, start, target):
+    """
+    Point-to-point Dijkstra growing one ball from each end.
+
+    The CSR is symmetric (undirected graph), so the backward search reads
+    the same arrays. Each step advances the side whose heap top is smaller;
+    every node labelled from both ends is a candidate path of cost mu. The
+    search stops once top_f + top_b >= mu: any path not yet seen would have
+    to be at least that long.
+    Returns ``(cost, previous, settled)``; ``cost`` is INF when the two
+    nodes are not connected and ``settled`` counts nodes taken from a heap.
+    """
+    offsets, neighbors, costs = csr.offsets, csr.neighbors, csr.costs
+
+    dist_f, dist_b = {start: 0}, {target: 0}
+    prev_f, prev_b = {start: -1}, {target: -1}
+    heap_f, heap_b = [(0, start)], [(0, target)]
+    done_f, done_b = set(), set()
+    mu = 0 if start == target else INF
+    meet = start if start == target else -1
+    settled = 0
+
+    while heap_f and heap_b:
+        if heap_f[0][0] + heap_b[0][0] >= mu:
+            break
+        if heap_f[0][0] <= heap_b[0][0]:
+            heap, dist, prev, done, other = heap_f, dist_f, prev_f, done_f, dist_b
+        else:
+            heap, dist, prev, done, other = heap_b, dist_b, prev_b, done_b, dist_f
+
+        d, i = heapq.heappop(heap)
+        if i in done:
+            continue  # stale entry
+        done.add(i)
+        settled += 1
+
+        for k in range(offsets[i], offsets[i + 1]):
+            j = neighbors[k]
+            nd = d + costs[k]
+            if nd < dist.get(j, INF):
+                dist[j] = nd
+                prev[j] = i
+                heapq.heappush(heap, (nd, j))
+                # Labels only shrink and both sides check here, so every
+                # node labelled from both ends is considered as a meet.
+                if j in other and nd + other[j] < mu:
+                    mu = nd + other[j]
+                    meet = j
+
+    if meet == -1:
+        return INF, {}, settled
+
+    # Stitch start -> meet (forward tree) and meet -> target (backward tree)
+    # into a single previous map keyed by row index.
+    previous = {}
+    i = meet
+    while i != -1:
+        previous[i] = prev_f[i]
+        i = prev_f[i]
+    i, after = meet, prev_b[meet]
+    while after != -1:
+        previous[after] = i
+        i, after = after, prev_b[after]
+    return mu, previous, settled
+
+
+def reconstruct(csr, start, end, previous):
+    """Node ids on the path start -> end following ``previous`` (row indices)."""
+    if end not in previous:
+        raise ValueError("Bu iki node arasında yol yok")
+    path = []
+    i = end
+    while i != -1:
+        path.append(csr.ids[i])
+        i = previous[i]
+    path.reverse()
+    return path
+
+
+class Dijkstra:
+    @staticmethod
+    def run(graph, start_id, end_id):
+        """Shortest (path, cost) between two nodes of a Graph or CSRGraph."""
+        csr, start, end = query_rows(graph, start_id, end_id)
+
+        dist, previous = shortest_paths(csr, start, end)
+        return reconstruct(csr, start, end, previous), dist[end]
+
+    @staticmethod
+    def run_bidirectional(graph, start_id, end_id):
+        """Same (path, cost) as run(), searched from both ends at once."""
+        csr, start, end = query_rows(graph, start_id, end_id)
+
+        cost, previous, _ = bidirectional(csr, start, end)
+        return reconstruct(csr, start, end, previous), cost
+
+    @staticmethod
+    def all_distances(graph, start_id):
+        """{node id: distance} for every node reachable from start_id."""
+        csr = as_csr(graph)
+        start = csr.index(start_id)
+
+        dist, _ = shortest_paths(csr, start)
+        ids = csr.ids
+        return {ids[i]: d for i, d in dist.items()}
@@ -0,0 +1,100 @@
+from array import array
+
+from .dijkstra import INF, shortest_paths
+
+FARTHEST = "farthest"
+DEGREE = "degree"
+
+
+def _distances(csr, source):
+    """Costs from row ``source`` to every row as a flat array('d'), INF if unreachable."""
+    dist, _ = shortest_paths(csr, source)
+    out = array("d", [INF]) * len(csr.ids)
+    for i, d in dist.items():
+        out[i] = d
+    return out
+
+
+def select_degree(csr, k):
+    """The k rows with the most neighbours."""
+    offsets = csr.offsets
+    order = sorted(range(len(csr.ids)), key=lambda i: offsets[i] - offsets[i + 1])
+    return order[:k]
+
+
+class LandmarkIndex:
+    """
+    ALT (A*, landmarks, triangle inequality) preprocessing over a CSRGraph.
+
+    For k landmark rows L the index keeps d_L, the shortest-path cost from
+    L to every row, in one array('d') per landmark (8 bytes per node per
+    landmark). Edges are undirected, so for any rows i, t
+
+        cost(i, t) >= |d_L(t) - d_L(i)|
+
+    and the maximum over all landmarks is a consistent A* heuristic.
+    The index belongs to the snapshot it was built from; Graph stops using
+    it after the next mutation.
+    """
+
+    def __init__(self, csr, k=8, strategy=FARTHEST):
+        if strategy not in (FARTHEST, DEGREE):
+            raise ValueError(f"Bilinmeyen landmark seçimi: {strategy}")
+        self.csr = csr
+        self.k = k
+        self.strategy = strategy
+        self.landmarks = []
+        self.distances = []
+
+        n = len(csr.ids)
+        k = min(k, n)
+        if not k:
+            return
+
+        if strategy == DEGREE:
+            for row in select_degree(csr, k):
+                self._add(row)
+            return
+
+        # Farthest-point: start from the best-connected node, then keep
+        # adding the row farthest from every landmark chosen so far.
+        # Rows no landmark reaches (closest = INF) are taken first, so each
+        # connected component gets a landmark of its own.
+        self._add(select_degree(csr, 1)[0])
+        closest = array("d", self.distances[0])
+        while len(self.landmarks) < k:
+            chosen = set(self.landmarks)
+            row = max((i for i in range(n) if i not in chosen), key=closest.__getitem__)
+            if closest[row] == 0:
+                break  # every remaining row coincides with a landmark
+            dist = self._add(row)
+            for i in range(n):
+                if dist[i] < closest[i]:
+                    closest[i] = dist[i]
+
+    def _add(self, row):
+        dist = _distances(self.csr, row)
+        self.landmarks.append(row)
+        self.distances.append(dist)
+        return dist
+
+    def heuristic(self, csr, target):
+        """
+        ``heuristic(csr, target) -> h`` factory for a_star.search. Only the
+        k values d_L(target) are read up front; h(i) is computed when A*
+        asks for row i, so a query costs O(k) per expanded row, not O(kV).
+        """
+        if csr is not self.csr:
+            raise ValueError("Landmark indeksi bu graf anlık görüntüsüne ait değil")
+
+        pairs = [(dist, dist[target]) for dist in self.distances]
+
+        def h(i):
+            best = 0.0
+            for dist, dt in pairs:
+                b = abs(dt - dist[i])
+                if b > best:
+                    best = b
+            return best
+
+        return h
@@ -0,0 +1,111 @@
+import threading
+from array import array
+from collections import OrderedDict
+
+from .dijkstra import INF, shortest_paths
+
+# Cost function key for the CSR's precomputed 1 / Edge.weight costs.
+INVERSE_WEIGHT = "1/weight"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# One distance (float) and one predecessor (int64) per node.
+BYTES_PER_NODE = array("d").itemsize + array("q").itemsize
+
+
+class ShortestPathTree:
+    """
+    Full single-source Dijkstra result over a CSR snapshot: ``dist[i]``
+    (INF if unreachable) and ``previous[i]`` (-1 at the source and for
+    unreachable rows), both flat arrays indexed by CSR row.
+    """
+
+    def __init__(self, csr, source):
+        n = len(csr.ids)
+        dist_map, prev_map = shortest_paths(csr, source)
+        self.csr = csr
+        self.source = source
+        self.dist = array("d", [INF]) * n
+        self.previous = array("q", [-1]) * n
+        for i, d in dist_map.items():
+            self.dist[i] = d
+        for i, p in prev_map.items():
+            self.previous[i] = p
+
+    @property
+    def nbytes(self):
+        return BYTES_PER_NODE * len(self.dist)
+
+    def path(self, end):
+        """(node id path, cost) from the source to CSR row ``end``."""
+        if self.dist[end] == INF:
+            raise ValueError("Bu iki node arasında yol yok")
+        ids, previous = self.csr.ids, self.previous
+        path = []
+        i = end
+        while i != -1:
+            path.append(ids[i])
+            i = previous[i]
+        path.reverse()
+        return path, self.dist[end]
+
+
+class SSSPCache:
+    """
+    LRU cache of ShortestPathTrees keyed by (source row, graph version,
+    cost function), bounded by the total size of their arrays.
+
+    Versions only grow, so a tree of an older version can never be hit
+    again; those are dropped as soon as a newer version is seen.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._trees = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._trees)
+
+    def fits(self, csr):
+        """Whether a tree over csr fits in the budget, i.e. can be cached at all."""
+        return BYTES_PER_NODE * len(csr.ids) <= self.max_bytes
+
+    def tree(self, csr, source, version, cost=INVERSE_WEIGHT):
+        """
+        Cached tree for source, computed (and stored) on a miss. Callers
+        should check fits() first: a tree that does not fit is built and
+        then thrown away.
+        """
+        key = (source, version, cost)
+        with self._lock:
+            if self._version is None or version > self._version:
+                self._drop_all()
+                self._version = version
+            tree = self._trees.get(key)
+            if tree is not None:
+                self._trees.move_to_end(key)
+                self.hits += 1
+                return tree
+            self.misses += 1
+
+        tree = ShortestPathTree(csr, source)
+        with self._lock:
+            if version == self._version and self.fits(csr):
+                if key not in self._trees:
+                    self.nbytes += tree.nbytes
+                self._trees[key] = tree
+                while self.nbytes > self.max_bytes:
+                    _, old = self._trees.popitem(last=False)
+                    self.nbytes -= old.nbytes
+        return tree
+
+    def _drop_all(self):
+        self._trees.clear()
+        self.nbytes = 0
+
+    def clear(self):
+        with self._lock:
+            self._drop_all()
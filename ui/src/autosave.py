@@ -0,0 +1,124 @@
+import atexit
+import os
+import tempfile
+import threading
+import time
+
+
+def atomic_write(path, write, mode="w"):
+    """
+    Writes a file so that readers only ever see the old or the new content:
+    ``write(f)`` fills a temp file next to ``path``, which is fsynced and
+    then renamed over ``path``.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        if "b" in mode:
+            f = os.fdopen(fd, mode)
+        else:
+            f = os.fdopen(fd, mode, encoding="utf-8")
+        with f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class AutosaveWriter:
+    """
+    Debounced background saver.
+
+    ``schedule()`` is cheap and can be called after every mutation. Once no
+    new call has arrived for ``delay`` seconds (or ``max_delay`` seconds after
+    the first pending call, whichever comes first), the writer thread calls
+    ``snapshot()`` to take an immutable copy of the data and hands it to
+    ``write(snapshot)``. Pending work is flushed at interpreter exit.
+    """
+
+    def __init__(self, snapshot, write, delay=1.0, max_delay=None):
+        self._snapshot = snapshot
+        self._write = write
+        self.delay = delay
+        self.max_delay = max_delay if max_delay is not None else delay * 10
+
+        self._cond = threading.Condition()
+        self._pending = False
+        self._flush_now = False
+        self._writing = False
+        self._closed = False
+        self._first = 0.0
+        self._due = 0.0
+        self._thread = None
+
+    def schedule(self):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("AutosaveWriter kapatıldı")
+            now = time.monotonic()
+            if not self._pending:
+                self._pending = True
+                self._first = now
+            self._due = min(now + self.delay, self._first + self.max_delay)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="graph-autosave", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+            self._cond.notify_all()
+
+    def flush(self):
+        """Writes any pending change now and waits until it is on disk."""
+        with self._cond:
+            if self._pending:
+                self._flush_now = True
+                self._cond.notify_all()
+            while self._pending or self._writing:
+                self._cond.wait()
+
+    def close(self):
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            atexit.unregister(self.close)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+
+                while not self._flush_now:
+                    remaining = self._due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                self._pending = False
+                self._flush_now = False
+                self._writing = True
+
+            try:
+                self._write(self._snapshot())
+            except Exception as e:
+                print(f"Autosave error: {e}")
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
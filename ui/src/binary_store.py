@@ -0,0 +1,212 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from .csr import CSRGraph
+
+BINARY_EXT = ".ygraph"
+
+MAGIC = b"YZGRAPH\0"
+FORMAT_VERSION = 1
+
+# Section name -> array typecode; every section is 8-byte aligned.
+SECTIONS = (
+    ("ids", "q"),
+    ("aktiflik", "d"),
+    ("etkilesim", "q"),
+    ("baglanti_sayisi", "q"),
+    ("komsu_offsets", "q"),     # node_count + 1 offsets into komsular
+    ("komsular", "q"),          # komsular lists as stored, dangling ids included
+    ("offsets", "q"),           # CSR row offsets, node_count + 1
+    ("neighbors", "q"),         # CSR neighbour indices
+    ("weights", "d"),           # stored weight per CSR slot
+    ("costs", "d"),             # per-hop cost per CSR slot
+    ("edge_source", "q"),       # edges in Graph.edges order
+    ("edge_target", "q"),
+    ("edge_weight", "d"),
+    ("name_offsets", "q"),      # node_count + 1 offsets into names
+    ("names", "B"),             # utf-8 blob
+)
+
+# magic, version, little-endian flag, node count, CSR slots, edge count, journal seq
+_HEADER = struct.Struct("<8sIIqqqq")
+_TABLE = struct.Struct(f"<{2 * len(SECTIONS)}q")
+_DATA_START = _HEADER.size + _TABLE.size
+
+
+def collect(graph, journal_seq=0):
+    """
+    Copies everything the binary format needs out of a graph. Cheap enough to
+    run under the graph lock; the result can be written later on any thread.
+    """
+    csr = graph.compile()
+    store = graph._store
+    edges = list(graph._edge_index.values())
+
+    try:
+        ids = array("q", store.ids)
+        edge_source = array("q", (e.source for e in edges))
+        edge_target = array("q", (e.target for e in edges))
+        komsu_offsets, komsular = store.komsular.flat()
+    except (TypeError, OverflowError):
+        raise ValueError("Binary format sadece tam sayı node ID'lerini destekler") from None
+
+    name_offsets, names = store.names.blob()
+
+    columns = {
+        "ids": ids,
+        "aktiflik": array("d", store.aktiflik),
+        "etkilesim": array("q", store.etkilesim),
+        "baglanti_sayisi": array("q", store.baglanti_sayisi),
+        "komsu_offsets": komsu_offsets,
+        "komsular": komsular,
+        "offsets": csr.offsets,
+        "neighbors": csr.neighbors,
+        "weights": csr.weights,
+        "costs": csr.costs,
+        "edge_source": edge_source,
+        "edge_target": edge_target,
+        "edge_weight": array("d", (e.weight for e in edges)),
+        "name_offsets": name_offsets,
+        "names": names,
+    }
+    return columns, journal_seq
+
+
+def write(f, snapshot):
+    """Writes a collect() result to a binary file object."""
+    columns, journal_seq = snapshot
+    if sys.byteorder != "little":
+        raise ValueError("Binary format little-endian sistem gerektirir")
+
+    blobs = [memoryview(columns[name]).cast("B") for name, _ in SECTIONS]
+    offsets, lengths = [], []
+    pos = _DATA_START
+    for blob in blobs:
+        offsets.append(pos)
+        lengths.append(len(blob))
+        pos += len(blob) + (-len(blob) % 8)
+
+    f.write(_HEADER.pack(
+        MAGIC, FORMAT_VERSION, 1,
+        len(columns["ids"]), len(columns["neighbors"]),
+        len(columns["edge_source"]), journal_seq,
+    ))
+    f.write(_TABLE.pack(*offsets, *lengths))
+    for blob in blobs:
+        f.write(blob)
+        f.write(b"\0" * (-len(blob) % 8))
+
+
+class BinarySnapshot:
+    """
+    Read-only, memory-mapped view of a binary graph file.
+
+    Opening only parses the fixed-size header; columns are memoryviews into
+    the mapping, so pages are read from disk when they are first touched.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._views = []
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Boş ya da geçersiz binary graph dosyası") from None
+
+        if len(self._mmap) < _DATA_START:
+            self.close()
+            raise ValueError("Geçersiz binary graph dosyası")
+
+        (magic, version, little, self.node_count, self.slot_count,
+         self.edge_count, self.journal_seq) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError("Desteklenmeyen binary graph dosyası")
+        if not little or sys.byteorder != "little":
+            self.close()
+            raise ValueError("Binary format little-endian sistem gerektirir")
+
+        table = _TABLE.unpack_from(self._mmap, _HEADER.size)
+        n = len(SECTIONS)
+        self._sections = {
+            name: (table[i], table[n + i], code)
+            for i, (name, code) in enumerate(SECTIONS)
+        }
+
+    def raw(self, name):
+        offset, length, _ = self._sections[name]
+        view = memoryview(self._mmap)[offset:offset + length]
+        self._views.append(view)
+        return view
+
+    def column(self, name):
+        _, _, code = self._sections[name]
+        view = self.raw(name).cast(code)
+        self._views.append(view)
+        return view
+
+    def name(self, i):
+        offsets = self.column("name_offsets")
+        return bytes(self.raw("names")[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+    def copy(self, name):
+        """A column copied into an array; unlike column() it outlives close()."""
+        _, _, code = self._sections[name]
+        out = array(code)
+        out.frombytes(self.raw(name))
+        return out
+
+    def csr(self, copy=False):
+        """
+        CSRGraph whose buffers point straight into the mapping, which makes
+        this the O(1) way to run algorithms on a file. ``copy=True`` copies
+        the buffers instead, so the CSR stays usable after close().
+        """
+        column = self.copy if copy else self.column
+        ids = column("ids")
+        return CSRGraph(
+            ids.tolist() if copy else ids,
+            column("offsets"),
+            column("neighbors"),
+            column("weights"),
+            column("costs"),
+            column("aktiflik"),
+            column("etkilesim"),
+            column("baglanti_sayisi"),
+        )
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def is_binary_path(path):
+    return str(path).endswith(BINARY_EXT)
+
+
+def convert(src, dst):
+    """Converts between graph.json and the binary format, chosen by file extension."""
+    from .graph import Graph
+
+    graph = Graph(data_path=src)
+    graph.save(dst)
+
+
+if __name__ == "__main__":
+    # python -m ui.src.binary_store data/graph.json data/graph.ygraph
+    convert(sys.argv[1], sys.argv[2])
@@ -0,0 +1,6 @@
+"""Optional dependencies, imported in one place for the whole package."""
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, callers fall back to plain Python
+    np = None
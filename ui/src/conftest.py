@@ -0,0 +1,101 @@
+import math
+import os
+import random
+import shutil
+
+import pytest
+
+from ui.src.graph import Graph
+from ui.src.node import Node
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+
+
+def graph_state(g):
+    """Everything a Graph holds, in a comparable form."""
+    nodes = sorted((n.id, n.name, n.aktiflik, n.etkilesim, tuple(sorted(n.komsular))) for n in g.nodes)
+    edges = sorted((e.source, e.target, e.weight) for e in g.edges)
+    return nodes, edges
+
+
+@pytest.fixture
+def state():
+    return graph_state
+
+
+@pytest.fixture
+def random_graph(tmp_path):
+    """200 nodes with random attributes and 600 random edges."""
+    rng = random.Random(7)
+    g = Graph(str(tmp_path / "graph.json"))
+    with g.batch():
+        for i in range(200):
+            g.add_node(Node(i, f"Node {i}", rng.random(), rng.randint(0, 100)))
+        while len(g.edges) < 600:
+            u, v = rng.sample(range(200), 2)
+            if not g.edge_exists(u, v):
+                g.add_edge(u, v)
+    return g
+
+
+@pytest.fixture
+def query_pairs(random_graph):
+    rng = random.Random(11)
+    ids = [n.id for n in random_graph.nodes]
+    return [tuple(rng.sample(ids, 2)) for _ in range(40)]
+
+
+def dijkstra_costs(g, start):
+    """Plain O(V²) Dijkstra by 1 / Edge.weight: {node id: cost} of reachable nodes."""
+    adjacency = {}
+    for e in g.edges:
+        adjacency.setdefault(e.source, []).append((e.target, 1 / e.weight))
+        adjacency.setdefault(e.target, []).append((e.source, 1 / e.weight))
+
+    dist = {start: 0.0}
+    done = set()
+    while len(done) < len(dist):
+        u = min((n for n in dist if n not in done), key=dist.__getitem__)
+        done.add(u)
+        for v, cost in adjacency.get(u, ()):
+            if dist[u] + cost < dist.get(v, math.inf):
+                dist[v] = dist[u] + cost
+    return dist
+
+
+@pytest.fixture
+def reference_costs():
+    return dijkstra_costs
+
+
+@pytest.fixture
+def check_paths(random_graph, query_pairs):
+    """check(run) asserts that run(start, end) finds a shortest path for every query pair."""
+    g = random_graph
+
+    def check(run):
+        for start, end in query_pairs:
+            cost = dijkstra_costs(g, start).get(end)
+            if cost is None:
+                with pytest.raises(ValueError):
+                    run(start, end)
+                continue
+            path, found = run(start, end)
+            assert (path[0], path[-1]) == (start, end)
+            assert found == pytest.approx(cost)
+            assert sum(1 / g.get_edge(u, v).weight for u, v in zip(path, path[1:])) == pytest.approx(cost)
+
+    return check
+
+
+@pytest.fixture
+def data_dir():
+    return DATA_DIR
+
+
+@pytest.fixture
+def sample_graph(tmp_path):
+    """data/graph.json (40 nodes, imported weights) loaded from a copy."""
+    path = tmp_path / "graph.json"
+    shutil.copy(os.path.join(DATA_DIR, "graph.json"), path)
+    return Graph(str(path))
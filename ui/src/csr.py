@@ -0,0 +1,222 @@
+from array import array
+from collections import deque
+
+from .weights import edge_weights
+from .algorithms.dijkstra import Dijkstra
+from .algorithms.a_star import AStar
+
+
+class CSRGraph:
+    """
+    Read-only compressed sparse row snapshot of a Graph.
+
+    Row i holds the neighbours of node ``ids[i]`` in
+    ``neighbors[offsets[i]:offsets[i + 1]]`` (in komsular order). ``weights``
+    are the stored edge weights (used for thresholds, 0 where komsular has
+    no Edge), ``costs`` are the per-hop costs charged by dijkstra/astar.
+    All buffers are flat ``array`` objects (or memoryviews over a mapped
+    binary snapshot), so they pickle cheaply and can be wrapped with
+    numpy.frombuffer.
+    """
+
+    def __init__(self, ids, offsets, neighbors, weights, costs,
+                 aktiflik, etkilesim, baglanti_sayisi):
+        self.ids = ids
+        self._index_of = None
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights
+        self.costs = costs
+        self.aktiflik = aktiflik
+        self.etkilesim = etkilesim
+        self.baglanti_sayisi = baglanti_sayisi
+
+    @classmethod
+    def from_graph(cls, graph):
+        # Rows of the graph's NodeStore are used directly as CSR indices.
+        store = graph._store
+        ids = list(store.ids)
+        index_of = store.row_of
+
+        offsets = array("q", [0])
+        rows = array("q")
+        neighbors = array("q")
+        edges = []
+
+        for i, (nid, komsular) in enumerate(zip(ids, store.komsular)):
+            for nb_id in komsular:
+                j = index_of.get(nb_id)
+                if j is None or nb_id == nid:
+                    continue
+                rows.append(i)
+                neighbors.append(j)
+                edges.append(graph.get_edge(nid, nb_id))
+            offsets.append(len(neighbors))
+
+        # A komsular entry without an Edge has weight 0, as Graph's
+        # connected_components and welsh_powell treat it. Dijkstra still
+        # walks it, charging the formula weight like the original did.
+        computed = edge_weights(store, rows, neighbors)
+        weights = array("d", (e.weight if e is not None else 0.0 for e in edges))
+        # Per-hop cost is 1 / stored weight, so it follows Edge.weight.
+        costs = array("d", (
+            1.0 / w if w > 0 else float("inf")
+            for w in (e.weight if e is not None else c for e, c in zip(edges, computed))
+        ))
+
+        return cls(
+            ids,
+            offsets,
+            neighbors,
+            weights,
+            costs,
+            array("d", store.aktiflik),
+            array("d", store.etkilesim),
+            array("d", store.baglanti_sayisi),
+        )
+
+    @property
+    def index_of(self):
+        # Built on first use, so opening a mapped snapshot stays O(1).
+        if self._index_of is None:
+            self._index_of = {nid: i for i, nid in enumerate(self.ids)}
+        return self._index_of
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def edge_count(self):
+        return len(self.neighbors) // 2
+
+    def index(self, node_id, message="Başlangıç node'u bulunamadı"):
+        """CSR row of node_id; ValueError(message) if it is not in the snapshot."""
+        i = self.index_of.get(node_id)
+        if i is None:
+            raise ValueError(message)
+        return i
+
+    def neighbor_range(self, i):
+        return range(self.offsets[i], self.offsets[i + 1])
+
+
+    def bfs(self, start_id):
+        start = self.index(start_id)
+        offsets, neighbors = self.offsets, self.neighbors
+
+        visited = bytearray(len(self.ids))
+        visited[start] = 1
+        queue = deque([start])
+        result = []
+
+        while queue:
+            i = queue.popleft()
+            result.append(i)
+            for k in range(offsets[i], offsets[i + 1]):
+                j = neighbors[k]
+                if not visited[j]:
+                    visited[j] = 1
+                    queue.append(j)
+
+        ids = self.ids
+        return [ids[i] for i in result]
+
+    def dfs(self, start_id):
+        start = self.index(start_id)
+        offsets, neighbors = self.offsets, self.neighbors
+
+        # Explicit stack of (node, next edge slot) reproduces the recursive
+        # pre-order of Graph.dfs without hitting the recursion limit.
+        visited = bytearray(len(self.ids))
+        visited[start] = 1
+        result = [start]
+        stack = [(start, offsets[start])]
+
+        while stack:
+            i, k = stack[-1]
+            end = offsets[i + 1]
+            while k < end and visited[neighbors[k]]:
+                k += 1
+            if k == end:
+                stack.pop()
+                continue
+            stack[-1] = (i, k + 1)
+            j = neighbors[k]
+            visited[j] = 1
+            result.append(j)
+            stack.append((j, offsets[j]))
+
+        ids = self.ids
+        return [ids[i] for i in result]
+
+    def connected_components(self, threshold=0.0):
+        offsets, neighbors, weights = self.offsets, self.neighbors, self.weights
+        ids = self.ids
+
+        visited = bytearray(len(ids))
+        components = []
+
+        for s in range(len(ids)):
+            if visited[s]:
+                continue
+
+            comp = []
+            stack = [s]
+            visited[s] = 1
+
+            while stack:
+                i = stack.pop()
+                comp.append(ids[i])
+                for k in range(offsets[i], offsets[i + 1]):
+                    if weights[k] < threshold:
+                        continue
+                    j = neighbors[k]
+                    if not visited[j]:
+                        visited[j] = 1
+                        stack.append(j)
+
+            components.append(comp)
+
+        return components
+
+    def welsh_powell(self, threshold=0.0):
+        offsets, neighbors, weights = self.offsets, self.neighbors, self.weights
+        n = len(self.ids)
+        order = sorted(range(n), key=lambda i: self.baglanti_sayisi[i], reverse=True)
+
+        color = [-1] * n
+        current_color = 0
+
+        for i in order:
+            if color[i] != -1:
+                continue
+
+            color[i] = current_color
+
+            for other in order:
+                if color[other] != -1:
+                    continue
+
+                conflict = False
+                for k in range(offsets[other], offsets[other + 1]):
+                    if color[neighbors[k]] == current_color and weights[k] >= threshold:
+                        conflict = True
+                        break
+
+                if not conflict:
+                    color[other] = current_color
+
+            current_color += 1
+
+        ids = self.ids
+        return {ids[i]: color[i] for i in order}
+
+
+    def dijkstra(self, start_id, end_id):
+        return Dijkstra.run(self, start_id, end_id)
+
+    def bidirectional_dijkstra(self, start_id, end_id):
+        return Dijkstra.run_bidirectional(self, start_id, end_id)
+
+    def astar(self, start_id, end_id, heuristic=None):
+        return AStar.run(self, start_id, end_id, heuristic)
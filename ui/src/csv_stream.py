@@ -0,0 +1,182 @@
+import glob
+import os
+from array import array
+
+NODE_ROWS = "nodes"
+EDGE_LIST = "edges"
+
+_EDGE_HEADER_WORDS = ("from", "to", "source", "target", "weight", "kaynak", "hedef", "agirlik")
+
+
+def _split(line):
+    # Comma or semicolon separated, empty fields (e.g. trailing comma) dropped.
+    parts = line.replace(';', ',').split(',')
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _is_header(line):
+    return bool(line) and not line[0].isdigit()
+
+
+def detect_format(path, sample_rows=100):
+    """
+    Tells a node-row file (DugumId, Aktiflik, Etkilesim, Baglanti, Komsular...)
+    apart from a ``from,to[,weight]`` edge list, looking only at the header
+    and the first few rows.
+    """
+    with open(path, "r", encoding="utf-8-sig") as f:
+        widest = 0
+        for i, line in enumerate(f):
+            line = line.strip()
+            if not line:
+                continue
+            if i == 0 and _is_header(line):
+                header = [p.lower() for p in _split(line)]
+                if any(word in header for word in _EDGE_HEADER_WORDS):
+                    return EDGE_LIST
+                return NODE_ROWS
+            widest = max(widest, len(_split(line)))
+            if i >= sample_rows:
+                break
+
+    return EDGE_LIST if 0 < widest <= 3 else NODE_ROWS
+
+
+def iter_rows(path, progress=None):
+    """
+    Yields the split fields of every data line, reading the file
+    incrementally. ``progress(bytes_read, total_bytes)`` is called as the
+    file is consumed.
+    """
+    total = os.path.getsize(path)
+    done = 0
+    step = max(total // 100, 1 << 16)
+    next_report = step
+
+    with open(path, "rb") as f:
+        for i, raw in enumerate(f):
+            done += len(raw)
+            if progress is not None and done >= next_report:
+                progress(done, total)
+                next_report = done + step
+
+            line = raw.decode("utf-8").strip()
+            if i == 0:
+                line = line.lstrip("\ufeff")
+            if not line:
+                continue
+            if i == 0 and _is_header(line):
+                continue
+            yield _split(line)
+
+    if progress is not None:
+        progress(total, total)
+
+
+def iter_chunks(rows, chunk_size=10000):
+    """Groups an iterator of rows into lists of at most chunk_size rows."""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parse_node_row(parts):
+    """(id, aktiflik, etkilesim, baglanti_sayisi, neighbors) or None for a bad row."""
+    if len(parts) < 5:
+        return None
+    try:
+        nid = int(parts[0])
+        act = float(parts[1])
+        inter = int(parts[2])
+        conn_count_val = int(parts[3])
+    except ValueError:
+        return None
+    neighbors = [int(p) for p in parts[4:] if p.isdigit()]
+    return nid, act, inter, conn_count_val, neighbors
+
+
+def parse_edge_row(parts):
+    """(source, target, weight or None) or None for a bad row."""
+    if len(parts) < 2:
+        return None
+    try:
+        u = int(parts[0])
+        v = int(parts[1])
+        w = float(parts[2]) if len(parts) > 2 else None
+    except ValueError:
+        return None
+    return u, v, w
+
+
+def parse_rows(rows, parse):
+    """Applies parse_node_row/parse_edge_row to split rows, dropping bad ones."""
+    return (parsed for parsed in map(parse, rows) if parsed is not None)
+
+
+def expand_paths(paths_or_glob):
+    """A glob pattern, a single path or a list of paths -> ordered list of files."""
+    if isinstance(paths_or_glob, (str, os.PathLike)):
+        pattern = os.fspath(paths_or_glob)
+        paths = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+    else:
+        paths = [os.fspath(p) for p in paths_or_glob]
+    if not paths:
+        raise ValueError("CSV dosyası bulunamadı")
+    return paths
+
+
+def parse_shard(path, fmt=None):
+    """
+    Parses one CSV shard into ready-to-merge columns. Runs in worker
+    processes, so it returns flat arrays, which pickle as raw bytes
+    instead of one object per value:
+
+      * edge list: (sources, targets, weights), already deduplicated,
+        self loops dropped; NaN stands for a missing weight.
+      * node rows: (ids, aktiflik, etkilesim, baglanti_sayisi, offsets,
+        neighbors) with row k's neighbours in
+        ``neighbors[offsets[k]:offsets[k + 1]]``.
+
+    Node rows are merged across shards by the caller.
+    """
+    rows = iter_rows(path)
+    if (fmt or detect_format(path)) == EDGE_LIST:
+        seen = set()
+        sources, targets, weights = array("q"), array("q"), array("d")
+        for u, v, w in parse_rows(rows, parse_edge_row):
+            key = (u, v) if u <= v else (v, u)
+            if u == v or key in seen:
+                continue
+            seen.add(key)
+            sources.append(u)
+            targets.append(v)
+            weights.append(float("nan") if w is None else w)
+        return sources, targets, weights
+
+    ids, aktiflik, etkilesim, baglanti = array("q"), array("d"), array("q"), array("q")
+    offsets, neighbors = array("q", [0]), array("q")
+    for nid, act, inter, conn_count_val, nbs in parse_rows(rows, parse_node_row):
+        ids.append(nid)
+        aktiflik.append(act)
+        etkilesim.append(inter)
+        baglanti.append(conn_count_val)
+        neighbors.extend(nbs)
+        offsets.append(len(neighbors))
+    return ids, aktiflik, etkilesim, baglanti, offsets, neighbors
+
+
+def shard_rows(fmt, columns):
+    """The parsed rows held in parse_shard() columns, as the loaders ingest them."""
+    if fmt == EDGE_LIST:
+        for u, v, w in zip(*columns):
+            yield u, v, (None if w != w else w)
+        return
+
+    ids, aktiflik, etkilesim, baglanti, offsets, neighbors = columns
+    for k, row in enumerate(zip(ids, aktiflik, etkilesim, baglanti)):
+        yield (*row, neighbors[offsets[k]:offsets[k + 1]].tolist())
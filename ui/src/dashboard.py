@@ -244,17 +244,13 @@ class DashboardWidget(QWidget):
         l_close.addWidget(QLabel("Yakınlık Merkeziliği (İlk 5)"))
         
         data_close = []
-        for n in top_deg[:5]:
-            try:
-                path, dists = image_dijkstra_all(graph, n.id) 
-                total_dist = sum(dists.values())
-                if total_dist > 0:
-                    val = (node_count - 1) / total_dist
-                else:
-                     val = 0
-                data_close.append((str(n.id), round(val, 4)))
-            except:
-                data_close.append((str(n.id), 0))
+        top_ids = [n.id for n in top_deg[:5]]
+        try:
+            distances = graph.all_pairs(sources=top_ids)
+            for nid in top_ids:
+                data_close.append((str(nid), round(distances.closeness(nid), 4)))
+        except Exception:
+            data_close = [(str(nid), 0) for nid in top_ids]
         
         chart_close = SimpleBarChart(data_close, color="#f59e0b")
         l_close.addWidget(chart_close)
@@ -265,28 +261,3 @@ class DashboardWidget(QWidget):
 
     def emit_back(self):
         self.back_clicked.emit()
-
-def image_dijkstra_all(graph, start_id):
-    import heapq
-    distances = {node.id: float("inf") for node in graph.nodes}
-    distances[start_id] = 0
-    pq = [(0, start_id)]
-    
-    while pq:
-        d, u = heapq.heappop(pq)
-        if d > distances[u]: continue
-        
-        u_node = graph.get_node_by_id(u)
-        if not u_node: continue
-        
-        for v in u_node.komsular:
-            v_node = graph.get_node_by_id(v)
-            weight = graph.calculate_weight(u_node, v_node)
-            cost = 1.0 / weight if weight > 0 else float('inf')
-            
-            if distances[u] + cost < distances[v]:
-                distances[v] = distances[u] + cost
-                heapq.heappush(pq, (distances[v], v))
-                
-    reachable = {k: v for k, v in distances.items() if v != float("inf")}
-    return None, reachable
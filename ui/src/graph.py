@@ -1,223 +1,802 @@
+import functools
+import gc
+import itertools
 import json
 import os
+import threading
+from array import array
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
 
-from .node import Node
+from .node import NeighborColumn, Node, NodeStore, StringColumn
 from .edge import Edge
+from .csr import CSRGraph
+from .algorithms.dijkstra import Dijkstra, query_rows
+from .algorithms.a_star import AStar
+from .algorithms.landmarks import FARTHEST, LandmarkIndex
+from .algorithms.all_pairs import DistanceMatrix
+from .algorithms.sssp_cache import SSSPCache
+from .weights import edge_weights
+from . import csv_stream
+from .autosave import AutosaveWriter, atomic_write
+from .journal import MutationJournal
+from . import binary_store
+from . import json_stream
+from . import sparse_export
+from . import load_cache
+
+
+def _mutation(method):
+    # Mutators run under the graph lock so the autosave thread only ever
+    # snapshots whole states.
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class Graph:
-    def __init__(self, data_path=None, autosave=False):
+    def __init__(self, data_path=None, autosave=False, autosave_delay=1.0,
+                 journal=False, journal_max_bytes=8 * 1024 * 1024):
         base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
         self.data_path = data_path or os.path.join(base_dir, "data", "graph.json")
         self.autosave = autosave
-
-        self.nodes = []
-        self.edges = []
+        # Seconds of quiet before a background autosave; 0/None saves synchronously.
+        self.autosave_delay = autosave_delay
+        self._writer = None
+        self._lock = threading.RLock()
+
+        self._store = NodeStore()
+        # (min_id, max_id) -> Edge; insertion ordered, so it doubles as edge storage
+        self._edge_index = {}
+
+        # Bumped on every mutation; derived snapshots are dropped with it.
+        self.version = 0
+        self._csr = None
+
+        # Optional ALT index for astar(), set by build_landmarks().
+        self._landmarks = None
+        # Full all-pairs DistanceMatrix of self.version
+        self._all_pairs = None
+        # Shortest-path trees of dijkstra() sources; exposes hits/misses.
+        self.sssp_cache = SSSPCache()
+
+        # Graph.batch() state; _undo is the undo log of the open batch.
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._undo = None
+
+        # Journal mode: mutations are appended to <data_path>.log instead of
+        # rewriting the snapshot; the log is folded back past journal_max_bytes.
+        self._journal = MutationJournal(self.data_path + ".log") if journal else None
+        self.journal_max_bytes = journal_max_bytes
+        self._journal_seq = 0
+        self._journal_pending = []
+        self._replaying = False
 
         if os.path.exists(self.data_path):
-            self.load_from_json(self.data_path)
+            self.load(self.data_path)
+        elif self._journal is not None:
+            self._replay_journal(0)
 
     
-    def load_from_csv(self, path):
-        import csv
-        self.nodes = []
-        self.edges = []
-        
-        # Format: DugumId, Ozellik_I (Aktiflik), Ozellik_II (Etkilesim), Ozellik_III (Baglanti), Komsular
-        # Delimiters can be comma or semicolon usually. We'll try to sniff or just assume standard CSV.
-        
-        nodes_dict = {}
-        
+    @_mutation
+    def load_from_csv(self, path, chunk_size=10000, progress=None):
+        """
+        Loads a CSV file in fixed-size chunks without holding all lines in memory.
+
+        Two layouts are recognised automatically:
+          * node rows: DugumId, Aktiflik, Etkilesim, Baglanti, Komsular...
+          * edge list: from, to[, weight] (like data/sample_40.csv)
+        ``progress(bytes_read, total_bytes)`` is called while reading.
+        """
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                # Read all lines to handle potential format issues manually
-                lines = f.readlines()
-                
-            # Skip header if present (check if first char is not digit)
-            start_idx = 0
-            if lines and not lines[0][0].isdigit():
-                start_idx = 1
-                
-            # First pass: Create Nodes
-            for line in lines[start_idx:]:
-                line = line.strip()
-                if not line: continue
-                
-                # Handle potential delimiters
-                parts = line.replace(';', ',').split(',')
-                # Filter empty strings from split (e.g. trailing comma)
-                parts = [p.strip() for p in parts if p.strip()]
-                
-                if len(parts) < 5: continue
-                
-                try:
-                    nid = int(parts[0])
-                    act = float(parts[1])
-                    inter = int(parts[2])
-                    # parts[3] is listed connection count, but we recalculate it usually or store it.
-                    # We will store it for weight calculation base.
-                    conn_count_val = int(parts[3]) 
-                    
-                    # Remaining parts are neighbors
-                    # Some inputs might have neighbors joined by spaces or specific format.
-                    # Standard requirement: "2,4,5"
-                    # But splitting by comma above might have split the neighbors too if they weren't quoted.
-                    # Let's re-parse neighbors carefully.
-                    # If parts were split by comma: [id, act, inter, count, n1, n2, n3...]
-                    neighbors_raw = parts[4:]
-                    neighbors = []
-                    for n_str in neighbors_raw:
-                        if n_str.isdigit():
-                            neighbors.append(int(n_str))
-                            
-                    node = Node(nid, f"Node {nid}", act, inter, conn_count_val, neighbors)
-                    # Note: We pass neighbors to constructor if supported, otherwise attribute
-                    # Node definition in this codebase seemed to take (id, name, act, inter) initially?
-                    # Let's check Node __init__ signature usage in previous code:
-                    # Node(nid, f"Node {nid}", act, inter) -> checking file outline/content helps.
-                    # Looking at line 33 of original file: n = Node(nid, f"Node {nid}", act, inter)
-                    # And line 73: n["komsular"] passed to constructor? 
-                    # Let's be safe and set attributes.
-                    
-                    # The original load_from_json passed 6 args. Let's check Node class definition?
-                    # I'll just assign to .komsular to be safe.
-                    node.komsular = neighbors
-                    
-                    self.nodes.append(node)
-                    nodes_dict[nid] = node
-                except ValueError:
-                    continue
+            self._load_csv(path, chunk_size, progress)
+        except Exception as e:
+            print(f"Error loading CSV: {e}")
 
-            # Second pass: Create Edges
-            # We don't want duplicate edges (1-2 and 2-1).
-            added_pairs = set()
-            
-            for node in self.nodes:
-                for neighbor_id in node.komsular:
-                    if neighbor_id not in nodes_dict:
+    def _load_csv(self, path, chunk_size=10000, progress=None):
+        self._replace(NodeStore(), {})
+
+        fmt = csv_stream.detect_format(path)
+        rows = csv_stream.iter_rows(path, progress)
+
+        if fmt == csv_stream.EDGE_LIST:
+            parsed = csv_stream.parse_rows(rows, csv_stream.parse_edge_row)
+            self._ingest_edge_list(csv_stream.iter_chunks(parsed, chunk_size))
+        else:
+            parsed = csv_stream.parse_rows(rows, csv_stream.parse_node_row)
+            self._ingest_node_rows(csv_stream.iter_chunks(parsed, chunk_size))
+
+        self._mark_dirty()
+
+        if self._journal is not None:
+            self.compact_journal()
+        self._autosave()
+
+    @_mutation
+    def load_cached(self, path, cache=None, progress=None):
+        """
+        Loads a CSV or graph.json file through a LoadCache (the shared
+        default one unless given). A hit reads the parsed, weighted graph
+        from a binary snapshot and skips parsing and weight computation.
+        Journal mode and binary sources always load directly.
+        """
+        is_csv = path.lower().endswith(".csv")
+        if self._journal is not None or binary_store.is_binary_path(path):
+            return self._load_csv(path, progress=progress) if is_csv else self.load(path)
+
+        cache = cache or load_cache.default_cache()
+        key = cache.key(path)
+        entry = cache.lookup(key)
+        if entry is not None:
+            try:
+                self.load_binary(entry)
+            except (OSError, ValueError):
+                cache.discard(key)
+            else:
+                if is_csv:
+                    # Same side effect as load_from_csv: the new graph is saved.
+                    self._autosave()
+                if progress is not None:
+                    progress(1, 1)
+                return
+
+        if is_csv:
+            self._load_csv(path, progress=progress)
+        else:
+            self.load(path)
+
+        # Don't cache a file that changed while it was being read.
+        if cache.key(path) == key:
+            cache.store(key, self)
+
+    def import_csv_shards(self, paths_or_glob, workers=None, chunk_size=10000, progress=None):
+        """
+        Replaces the graph with the union of several CSV shards (a list of
+        paths or a glob such as ``"data/shards/*.csv"``).
+
+        Shards are parsed in a process pool (``workers`` processes, default
+        os.cpu_count()) into flat columns (csv_stream.parse_shard). Each
+        shard is merged as soon as it arrives, in shard order, while the
+        later ones are still being parsed; duplicate nodes and (u, v) pairs
+        are dropped and nothing but the shard being merged is held. All
+        shards must use the same layout. ``progress(done, total)`` is called
+        as shards are merged.
+        """
+        paths = csv_stream.expand_paths(paths_or_glob)
+        formats = {csv_stream.detect_format(path) for path in paths}
+        if len(formats) > 1:
+            raise ValueError("Shard'lar aynı CSV biçiminde olmalı")
+        fmt = formats.pop()
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+
+        def merged(shards):
+            for done, columns in enumerate(shards, 1):
+                yield from csv_stream.shard_rows(fmt, columns)
+                if progress is not None:
+                    progress(done, len(paths))
+
+        with ExitStack() as stack:
+            if workers == 1:
+                shards = (csv_stream.parse_shard(path, fmt) for path in paths)
+            else:
+                pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                shards = pool.map(csv_stream.parse_shard, paths, itertools.repeat(fmt))
+            chunks = csv_stream.iter_chunks(merged(shards), chunk_size)
+
+            with self._lock:
+                self._replace(NodeStore(), {})
+                if fmt == csv_stream.EDGE_LIST:
+                    self._ingest_edge_list(chunks)
+                else:
+                    self._ingest_node_rows(chunks)
+
+                self._mark_dirty()
+                if self._journal is not None:
+                    self.compact_journal()
+                self._autosave()
+
+    def _ingest_node_rows(self, chunks):
+        store = self._store
+        with store.bulk():
+            self._ingest_node_chunks(store, chunks)
+
+    def _ingest_node_chunks(self, store, chunks):
+        # neighbour id -> rows that listed it before its own row showed up
+        pending = {}
+
+        for chunk in chunks:
+            src_rows = array("q")
+            dst_rows = array("q")
+            chunk_pairs = set()
+
+            for parsed in chunk:
+                if parsed[0] in store:
+                    continue
+                nid, act, inter, conn_count_val, neighbors = parsed
+
+                # The table's connection count is kept for the weight formula, as per requirement.
+                row = store.append(nid, f"Node {nid}", act, inter, conn_count_val, neighbors)
+
+                candidates = [
+                    (store.row_of[nb_id], row) for nb_id in neighbors if nb_id in store
+                ]
+                for nb_id in neighbors:
+                    if nb_id not in store:
+                        pending.setdefault(nb_id, []).append(row)
+                candidates.extend((r, row) for r in pending.pop(nid, ()))
+
+                for i, j in candidates:
+                    if i == j: continue # No self loops
+                    u, v = store.ids[i], store.ids[j]
+                    # We don't want duplicate edges (1-2 and 2-1).
+                    pair = self._edge_key(u, v)
+                    if pair in self._edge_index or pair in chunk_pairs:
                         continue
-                        
-                    n1 = node
-                    n2 = nodes_dict[neighbor_id]
-                    
-                    # Sort to check uniqueness
-                    pair = tuple(sorted((n1.id, n2.id)))
-                    if pair in added_pairs:
+                    chunk_pairs.add(pair)
+                    src_rows.append(i)
+                    dst_rows.append(j)
+                    # Keep adjacency symmetric like add_edge does, so removals
+                    # only need to visit the removed node's own neighbours.
+                    store.komsular.add(i, v)
+                    store.komsular.add(j, u)
+
+            # Both endpoints of every edge found in this chunk are final, weight them together.
+            for i, j, w in zip(src_rows, dst_rows, edge_weights(store, src_rows, dst_rows)):
+                u, v = store.ids[i], store.ids[j]
+                self._edge_index[self._edge_key(u, v)] = Edge(u, v, w)
+
+    def _ingest_edge_list(self, chunks):
+        store = self._store
+        # (row, neighbour id) pairs, laid out into komsular once at the end
+        adj_rows = array("q")
+        adj_ids = array("q")
+        unweighted = []
+        src_rows = array("q")
+        dst_rows = array("q")
+
+        with store.bulk():
+            row_of = store.row_of
+            for chunk in chunks:
+                for u, v, w in chunk:
+                    if u == v: continue # No self loops
+
+                    key = self._edge_key(u, v)
+                    if key in self._edge_index:
                         continue
-                        
-                    if n1.id == n2.id: continue # No self loops
-                    
-                    # Calculate weight
-                    w = self.calculate_weight(n1, n2)
-                    self.edges.append(Edge(n1.id, n2.id, w))
-                    added_pairs.add(pair)
-            
-            # Recalculate connection counts if we want to ensure consistency with loaded edges,
-            # but the requirement says "Use the table". The table had a connection count column.
-            # Using the loaded 'baglanti_sayisi' for the weight formula as per requirement.
-            
-            self._autosave()
-            
-        except Exception as e:
-            print(f"Error loading CSV: {e}")
 
+                    i = row_of.get(u)
+                    if i is None:
+                        i = store.append(u, f"Node {u}")
+                    j = row_of.get(v)
+                    if j is None:
+                        j = store.append(v, f"Node {v}")
+                    adj_rows.append(i)
+                    adj_ids.append(v)
+                    adj_rows.append(j)
+                    adj_ids.append(u)
+
+                    edge = Edge(u, v, w if w is not None else 0.0)
+                    self._edge_index[key] = edge
+                    if w is None:
+                        unweighted.append(edge)
+                        src_rows.append(i)
+                        dst_rows.append(j)
+
+            store.komsular.extend(adj_rows, adj_ids)
+
+        # Edge lists carry no degree column, so it is derived from the adjacency.
+        store.baglanti_sayisi = array("q", map(store.komsular.degree, range(len(store))))
+
+        for e, w in zip(unweighted, edge_weights(store, src_rows, dst_rows)):
+            e.weight = w
+
+    @_mutation
+    def load_from_json(self, path, nodes_only=False, edge_filter=None):
+        """
+        Reads graph.json incrementally, building the node store and edge
+        index element by element without decoding the whole document first.
 
-   
-    def load_from_json(self, path):
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        self.nodes = [
-            Node(
-                n["id"],
-                n["name"],
-                n["aktiflik"],
-                n["etkilesim"],
-                n["baglanti_sayisi"],
-                n["komsular"]
-            )
-            for n in data.get("nodes", [])
-        ]
-
-        self.edges = [
-            Edge(e["from"], e["to"], e["weight"])
-            for e in data.get("edges", [])
-        ]
-
-    def save_to_json(self, path):
-        data = {
-            "nodes": [
-                {
-                    "id": n.id,
-                    "name": n.name,
-                    "aktiflik": n.aktiflik,
-                    "etkilesim": n.etkilesim,
-                    "baglanti_sayisi": n.baglanti_sayisi,
-                    "komsular": n.komsular
-                }
-                for n in self.nodes
-            ],
-            "edges": [
-                {
-                    "from": e.source,
-                    "to": e.target,
-                    "weight": e.weight
-                }
-                for e in self.edges
-            ]
-        }
-
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        ``nodes_only=True`` skips the edges; ``edge_filter(source, target,
+        weight)`` keeps only the edges it returns True for. After such a
+        partial load komsular are limited to the loaded edges.
+        """
+        partial = nodes_only or edge_filter is not None
+        if partial and self._journal is not None and (
+                os.path.abspath(path) == os.path.abspath(self.data_path)):
+            raise ValueError("Journal modunda data_path kısmi yüklenemez")
+
+        store = NodeStore()
+        edge_index = {}
+        journal_seq = 0
+
+        with open(path, "r", encoding="utf-8") as f, store.bulk():
+            for key, item in json_stream.iter_graph(f):
+                if key == "nodes":
+                    store.append(
+                        item["id"],
+                        item["name"],
+                        item["aktiflik"],
+                        item["etkilesim"],
+                        item["baglanti_sayisi"],
+                        item["komsular"]
+                    )
+                elif key == "edges":
+                    if nodes_only:
+                        continue
+                    u, v, w = item["from"], item["to"], item["weight"]
+                    if edge_filter is None or edge_filter(u, v, w):
+                        edge_index[self._edge_key(u, v)] = Edge(u, v, w)
+                elif key == "journal_seq":
+                    journal_seq = item
+
+            if partial:
+                for row, nid in enumerate(store.ids):
+                    store.komsular.set(row, [
+                        nb for nb in store.komsular[row]
+                        if self._edge_key(nid, nb) in edge_index
+                    ])
+
+        self._replace(store, edge_index)
+        self._mark_dirty()
+
+        self._after_load(path, journal_seq)
+
+    def _after_load(self, path, journal_seq):
+        if self._journal is not None:
+            if os.path.abspath(path) == os.path.abspath(self.data_path):
+                self._journal_seq = journal_seq
+                self._replay_journal(self._journal_seq)
+            else:
+                # The whole graph was replaced from another file.
+                self.compact_journal()
+
+    @_mutation
+    def load_binary(self, path):
+        """
+        Loads a binary snapshot written by save_binary() into editable
+        columns. This is O(V + E): the node columns (names and neighbour
+        lists included) are bulk-copied, but every edge still gets an Edge
+        object. The file's CSR section is copied too, so the first compile()
+        is free. Only binary_store.BinarySnapshot(path).csr() opens a file
+        in O(1), paging data in lazily; use it for read-only algorithm runs.
+        """
+        # Only new containers are allocated here; pausing the cyclic GC
+        # saves its repeated passes over the half-built graph.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with binary_store.BinarySnapshot(path) as snap:
+                store = NodeStore.from_columns(
+                    snap.column("ids"),
+                    StringColumn.from_blob(snap.raw("names"), snap.column("name_offsets")),
+                    snap.column("aktiflik"),
+                    snap.column("etkilesim"),
+                    snap.column("baglanti_sayisi"),
+                    NeighborColumn.from_flat(snap.column("komsular"), snap.column("komsu_offsets")),
+                )
+                edge_index = {}
+                for u, v, w in zip(snap.column("edge_source").tolist(),
+                                   snap.column("edge_target").tolist(),
+                                   snap.column("edge_weight").tolist()):
+                    edge_index[(u, v) if u <= v else (v, u)] = Edge(u, v, w)
+                csr = snap.csr(copy=True)
+                journal_seq = snap.journal_seq
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        self._replace(store, edge_index)
+        self._mark_dirty()
+        # collect() wrote the CSR of exactly this store and edge set.
+        self._csr = csr
+
+        self._after_load(path, journal_seq)
+
+    def save_binary(self, path):
+        with self._lock:
+            snapshot = binary_store.collect(self, self._journal_seq)
+
+        atomic_write(path, lambda f: binary_store.write(f, snapshot), mode="wb")
+
+    def load(self, path):
+        """Loads graph.json or a binary snapshot, chosen by file extension."""
+        if binary_store.is_binary_path(path):
+            self.load_binary(path)
+        else:
+            self.load_from_json(path)
+
+    def save(self, path):
+        """Saves as graph.json or a binary snapshot, chosen by file extension."""
+        if binary_store.is_binary_path(path):
+            self.save_binary(path)
+        else:
+            self.save_to_json(path)
+
+    def save_to_json(self, path, pretty=False):
+        """
+        Streams the graph to path one node/edge at a time. The lock is held
+        while writing so the file is a single consistent state.
+        ``pretty=True`` keeps the indented layout of older graph.json files.
+        """
+        with self._lock:
+            journal_seq = self._journal_seq if self._journal is not None else None
+            atomic_write(path, lambda f: json_stream.write_graph(
+                f,
+                json_stream.node_rows(self._store),
+                json_stream.edge_rows(self._edge_index.values()),
+                journal_seq,
+                pretty
+            ))
+
+    def _json_snapshot(self):
+        # Flat column copies for the autosave thread; much smaller than a dict tree.
+        store = self._store
+        columns = (
+            array("q", store.ids),
+            store.names.copy(),
+            array("d", store.aktiflik),
+            array("q", store.etkilesim),
+            array("q", store.baglanti_sayisi),
+            store.komsular.copy(),
+        )
+        edges = list(json_stream.edge_rows(self._edge_index.values()))
+        # Journal records up to this number are already in the snapshot.
+        journal_seq = self._journal_seq if self._journal is not None else None
+        return columns, edges, journal_seq
 
     def export_adjacency_matrix(self, path):
-        sorted_nodes = sorted(self.nodes, key=lambda n: n.id)
-        node_ids = [n.id for n in sorted_nodes]
-        n_count = len(node_ids)
-        
-        
-        matrix = []
-        header = [""] + [str(nid) for nid in node_ids]
-        matrix.append(header)
-        
-        for i, r_node in enumerate(sorted_nodes):
-            row = [str(r_node.id)]
-            for c_node in sorted_nodes:
-                val = "0"
-                if self.edge_exists(r_node.id, c_node.id):
-                   val = "1"
-                row.append(val)
-            matrix.append(row)
-            
-        import csv
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerows(matrix)
+        """Dense 0/1 adjacency matrix as CSV, written row by row."""
+        self.export_adjacency(path, sparse_export.DENSE)
+
+    def export_adjacency(self, path, fmt=None):
+        """
+        Writes the adjacency straight from the edge storage as a COO edge
+        list (.csv), Matrix Market (.mtx) or scipy-compatible CSR (.npz).
+        ``fmt`` overrides the format guessed from the extension; "dense"
+        gives the full matrix CSV.
+        """
+        fmt = fmt or sparse_export.format_for_path(path)
+        writer = sparse_export.WRITERS.get(fmt)
+        if writer is None:
+            raise ValueError(f"Bilinmeyen çıktı biçimi: {fmt}")
+        with self._lock:
+            writer(self, path)
+
+    def _mark_dirty(self):
+        self._csr = None
+        if self._batch_depth:
+            # The version bump happens once, when the batch commits.
+            self._batch_dirty = True
+        else:
+            self.version += 1
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups several mutations into one transaction:
+
+            with graph.batch():
+                graph.add_edge(1, 2)
+                graph.remove_node(7)
+
+        Autosave and cache invalidation run once when the block exits. While
+        a batch is open, mutators append what they overwrite to an undo log;
+        if an exception escapes, the log is replayed backwards, so a batch
+        costs as much as it changes, not as much as the graph holds. A nested
+        batch that raises is undone back to its own start. Only changes made
+        through Graph methods are undone, and restored edges go back at the
+        end of the edge order.
+        """
+        with self._lock:
+            outermost = not self._batch_depth
+            if outermost:
+                self._undo = []
+                self._batch_dirty = False
+            mark = (len(self._undo), len(self._journal_pending))
+
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._batch_depth -= 1
+                self._rollback(*mark)
+                if outermost:
+                    self._undo = None
+                raise
+            self._batch_depth -= 1
+            if not outermost:
+                return
+
+            self._undo = None
+            if self._journal_pending:
+                self._journal.append(self._journal_pending)
+                self._journal_pending = []
+            if self._batch_dirty:
+                self._batch_dirty = False
+                self._mark_dirty()
+                self._autosave()
+
+    def _rollback(self, undo_mark, journal_mark):
+        undo = self._undo
+        while len(undo) > undo_mark:
+            entry = undo.pop()
+            kind = entry[0]
+            store = self._store
+            if kind == "row":
+                _, row, name, aktiflik, etkilesim, baglanti_sayisi = entry
+                store.names[row] = name
+                store.aktiflik[row] = aktiflik
+                store.etkilesim[row] = etkilesim
+                store.baglanti_sayisi[row] = baglanti_sayisi
+            elif kind == "neighbors":
+                store.komsular.set(entry[1], entry[2])
+            elif kind == "neighbor_add":
+                store.komsular.discard(entry[1], entry[2])
+            elif kind == "append":
+                store.remove(store.ids[-1])
+            elif kind == "remove":
+                store.reinsert(*entry[1:])
+            elif kind == "edge_add":
+                del self._edge_index[entry[1]]
+            elif kind == "edge_remove":
+                self._edge_index[entry[1]] = entry[2]
+            elif kind == "weight":
+                entry[1].weight = entry[2]
+            elif kind == "weights":
+                for e, weight in zip(entry[1], entry[2]):
+                    e.weight = weight
+            elif kind == "replace":
+                self._store, self._edge_index = entry[1], entry[2]
+
+        del self._journal_pending[journal_mark:]
+        self._csr = None
+        if not self._batch_depth:
+            self._batch_dirty = False
+            self._mark_dirty()
+
+    # Storage primitives used by the mutators. Inside a batch each records
+    # the state it overwrites in the undo log.
+
+    def _save_row(self, row):
+        if self._undo is not None:
+            store = self._store
+            self._undo.append(("row", row, store.names[row], store.aktiflik[row],
+                               store.etkilesim[row], store.baglanti_sayisi[row]))
+
+    def _add_neighbor(self, row, nb_id):
+        if self._store.komsular.add(row, nb_id) and self._undo is not None:
+            self._undo.append(("neighbor_add", row, nb_id))
+
+    def _discard_neighbor(self, row, nb_id):
+        """Returns True if nb_id was a neighbour."""
+        komsular = self._store.komsular
+        if not komsular.contains(row, nb_id):
+            return False
+        if self._undo is not None:
+            # A copy, so that rollback restores the neighbour order exactly.
+            self._undo.append(("neighbors", row, komsular[row]))
+        komsular.discard(row, nb_id)
+        return True
+
+    def _append_node(self, node):
+        self._store.attach(node)
+        if self._undo is not None:
+            self._undo.append(("append",))
+
+    def _remove_node_row(self, node_id):
+        store = self._store
+        if self._undo is not None:
+            row = store.row_of[node_id]
+            self._undo.append((
+                "remove", row, node_id, store.names[row], store.aktiflik[row],
+                store.etkilesim[row], store.baglanti_sayisi[row],
+                store.komsular[row], store._live_view(row)
+            ))
+        store.remove(node_id)
+
+    def _put_edge(self, edge):
+        key = self._edge_key(edge.source, edge.target)
+        self._edge_index[key] = edge
+        if self._undo is not None:
+            self._undo.append(("edge_add", key))
+
+    def _pop_edge(self, u, v):
+        key = self._edge_key(u, v)
+        edge = self._edge_index.pop(key, None)
+        if edge is not None and self._undo is not None:
+            self._undo.append(("edge_remove", key, edge))
+        return edge
+
+    def _set_weight(self, edge, weight):
+        if self._undo is not None:
+            self._undo.append(("weight", edge, edge.weight))
+        edge.weight = weight
+
+    def _replace(self, store, edge_index):
+        """Swaps in whole new storage (loaders, nodes/edges setters)."""
+        if self._undo is not None:
+            self._undo.append(("replace", self._store, self._edge_index))
+        self._store = store
+        self._edge_index = edge_index
+
+    def _log(self, op, **fields):
+        if self._journal is None or self._replaying:
+            return
+        self._journal_seq += 1
+        record = {"seq": self._journal_seq, "op": op}
+        record.update(fields)
+
+        if self._batch_depth:
+            self._journal_pending.append(record)
+        else:
+            self._journal.append([record])
+
+    def _replay_journal(self, after_seq):
+        self._replaying = True
+        try:
+            with self.batch():
+                for record in self._journal.read(after_seq):
+                    try:
+                        self._apply_record(record)
+                    except (ValueError, KeyError) as e:
+                        print(f"Journal record {record.get('seq')} skipped: {e}")
+                    self._journal_seq = max(self._journal_seq, record.get("seq", 0))
+        finally:
+            self._replaying = False
+
+    def _apply_record(self, record):
+        op = record["op"]
+        if op == "add_node":
+            self.add_node(Node.from_dict(record["node"]))
+        elif op == "update_node":
+            self.update_node(
+                record["id"],
+                name=record.get("name"),
+                aktiflik=record.get("aktiflik"),
+                etkilesim=record.get("etkilesim")
+            )
+        elif op == "remove_node":
+            self.remove_node(record["id"])
+        elif op == "add_edge":
+            self.add_edge(record["source"], record["target"])
+        elif op == "remove_edge":
+            self.remove_edge(record["source"], record["target"])
+        elif op == "recompute_weights":
+            self.recompute_weights()
+        elif op == "apply_delta":
+            self.apply_delta(record["delta"])
+        else:
+            raise ValueError(f"Bilinmeyen journal kaydı: {op}")
+
+    @_mutation
+    def compact_journal(self):
+        """Folds the journal into a fresh snapshot of data_path and empties it."""
+        if self._journal is None:
+            return
+        self.save(self.data_path)
+        self._journal.truncate()
+
+    def compile(self):
+        """
+        Returns a read-only CSR snapshot of the graph for algorithm runs.
+        The snapshot is cached until the next mutation.
+        """
+        if self._csr is None:
+            self._csr = CSRGraph.from_graph(self)
+        return self._csr
 
     def _autosave(self):
-        if self.autosave and self.data_path:
-            self.save_to_json(self.data_path)
+        if self._batch_depth:
+            return
+        if self._journal is not None:
+            # Already persisted by the journal; only compact when it grows too big.
+            if not self._replaying and self._journal.size() > self.journal_max_bytes:
+                self.compact_journal()
+            return
+        if not (self.autosave and self.data_path):
+            return
+
+        if not self.autosave_delay:
+            self.save(self.data_path)
+            return
+
+        if self._writer is None:
+            self._writer = AutosaveWriter(
+                self._autosave_snapshot, self._write_snapshot, self.autosave_delay
+            )
+        self._writer.schedule()
+
+    def _autosave_snapshot(self):
+        # Runs on the writer thread; the lock keeps mutators out while copying.
+        with self._lock:
+            if binary_store.is_binary_path(self.data_path):
+                return self.data_path, binary_store.collect(self, self._journal_seq)
+            return self.data_path, self._json_snapshot()
+
+    @staticmethod
+    def _write_snapshot(snapshot):
+        path, data = snapshot
+        if binary_store.is_binary_path(path):
+            atomic_write(path, lambda f: binary_store.write(f, data), mode="wb")
+        else:
+            columns, edges, journal_seq = data
+            atomic_write(path, lambda f: json_stream.write_graph(
+                f, zip(*columns), edges, journal_seq
+            ))
+
+    def flush(self):
+        """Blocks until pending background autosaves are on disk."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self):
+        """Flushes pending autosaves and stops the writer thread."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._journal is not None:
+            self._journal.close()
 
     
+    @property
+    def nodes(self):
+        return self._store.views()
+
+    @nodes.setter
+    def nodes(self, nodes):
+        store = NodeStore()
+        for node in nodes:
+            store.attach(node)
+        with self._lock:
+            self._replace(store, self._edge_index)
+            self._mark_dirty()
+
+    @property
+    def edges(self):
+        return list(self._edge_index.values())
+
+    @edges.setter
+    def edges(self, edges):
+        edge_index = {self._edge_key(e.source, e.target): e for e in edges}
+        with self._lock:
+            self._replace(self._store, edge_index)
+            self._mark_dirty()
+
+    @staticmethod
+    def _edge_key(u, v):
+        return (u, v) if u <= v else (v, u)
+
+    def get_edge(self, source_id, target_id):
+        return self._edge_index.get(self._edge_key(source_id, target_id))
+
     def get_node_by_id(self, node_id):
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return self._store.get(node_id)
 
+    @_mutation
     def add_node(self, node: Node):
         if self.get_node_by_id(node.id) is not None:
             raise ValueError(f"Aynı ID'ye sahip node zaten var: {node.id}")
 
-        self.nodes.append(node)
+        self._append_node(node)
+        self._log("add_node", node=node.to_dict())
+        self._mark_dirty()
         self._autosave()
 
+    @_mutation
     def update_node(self, node_id, name=None, aktiflik=None, etkilesim=None):
+        """
+        Updates a node's attributes and reweights only its incident edges.
+        Returns the set of Edge objects whose weight changed.
+        """
         node = self.get_node_by_id(node_id)
         if node is None:
             raise ValueError("Node bulunamadı")
 
+        self._save_row(node._row)
         if name is not None:
             node.name = name
         if aktiflik is not None:
@@ -226,35 +805,194 @@ class Graph:
             node.etkilesim = int(etkilesim)
 
  
-        node.baglanti_sayisi = len(node.komsular)
-
-        for e in self.edges:
-            if e.source == node_id or e.target == node_id:
-                n1 = self.get_node_by_id(e.source)
-                n2 = self.get_node_by_id(e.target)
-                e.weight = self.calculate_weight(n1, n2)
-
-        self._autosave()    
+        komsular = node.komsular
+        node.baglanti_sayisi = len(komsular)
+
+        changed = set()
+        for nb_id in komsular:
+            e = self.get_edge(node_id, nb_id)
+            nb_node = self.get_node_by_id(nb_id)
+            if e is None or nb_node is None:
+                continue
+            n1, n2 = (node, nb_node) if e.source == node_id else (nb_node, node)
+            w = self.calculate_weight(n1, n2)
+            if w != e.weight:
+                self._set_weight(e, w)
+                changed.add(e)
+
+        self._log("update_node", id=node_id, name=name, aktiflik=aktiflik, etkilesim=etkilesim)
+        self._mark_dirty()
+        self._autosave()
+        return changed
 
+    @_mutation
     def remove_node(self, node_id):
         node = self.get_node_by_id(node_id)
         if node is None:
             raise ValueError("Node bulunamadı")
 
-        self.nodes = [n for n in self.nodes if n.id != node_id]
-
-        self.edges = [
-            e for e in self.edges
-            if e.source != node_id and e.target != node_id
-        ]
+        self._remove_node_row(node_id)
 
-        for n in self.nodes:
-            if node_id in n.komsular:
-                n.komsular.remove(node_id)
+        row_of = self._store.row_of
+        for nb_id in node.komsular:
+            self._pop_edge(node_id, nb_id)
+            if nb_id in row_of:
+                self._discard_neighbor(row_of[nb_id], node_id)
 
+        self._log("remove_node", id=node_id)
+        self._mark_dirty()
         self._autosave()
 
     
+    @_mutation
+    def recompute_weights(self):
+        """Recomputes every edge weight from node attributes, e.g. after bulk edits."""
+        row_of = self._store.row_of
+        edges = list(self._edge_index.values())
+        src_rows = array("q", (row_of[e.source] for e in edges))
+        dst_rows = array("q", (row_of[e.target] for e in edges))
+
+        if self._undo is not None:
+            self._undo.append(("weights", edges, array("d", (e.weight for e in edges))))
+        for e, w in zip(edges, edge_weights(self._store, src_rows, dst_rows)):
+            e.weight = w
+
+        self._log("recompute_weights")
+        self._mark_dirty()
+        self._autosave()
+
+    @_mutation
+    def apply_delta(self, delta):
+        """
+        Applies a change set (a dict or the path of a JSON file) in one batch:
+
+            {
+                "remove_edges": [{"from": 1, "to": 2}],
+                "remove_nodes": [7],
+                "add_nodes":    [{"id": 41, "name": "Node 41", "aktiflik": 0.5, "etkilesim": 3}],
+                "update_nodes": [{"id": 5, "aktiflik": 0.9}],
+                "add_edges":    [{"from": 41, "to": 5}]
+            }
+
+        Sections run in that order; every key is optional. Degrees of the
+        nodes involved are updated, but only the added edges and the edges
+        incident to updated nodes are (re)weighted, with the final degrees;
+        other stored weights are left as they are. Returns the set of added
+        or reweighted Edge objects. Any invalid entry rolls the whole delta
+        back.
+
+        The work (including the batch undo log) is proportional to the delta
+        and the degrees of the nodes it touches, not to the graph size. Only
+        persistence is not: autosave rewrites the snapshot, while journal
+        mode appends a single record.
+        """
+        if isinstance(delta, (str, os.PathLike)):
+            with open(delta, "r", encoding="utf-8") as f:
+                delta = json.load(f)
+
+        with self.batch():
+            store = self._store
+            edge_index = self._edge_index
+            # nodes whose degree may change / whose incident edges are reweighted
+            touched = set()
+            updated = set()
+            added = []
+
+            for u, v in map(self._delta_pair, delta.get("remove_edges", ())):
+                if self._pop_edge(u, v) is None:
+                    raise ValueError("Edge bulunamadı")
+                for a, b in ((u, v), (v, u)):
+                    if a in store:
+                        self._discard_neighbor(store.row_of[a], b)
+                        touched.add(a)
+
+            for node_id in delta.get("remove_nodes", ()):
+                node = store.get(node_id)
+                if node is None:
+                    raise ValueError("Node bulunamadı")
+                for nb_id in node.komsular:
+                    self._pop_edge(node_id, nb_id)
+                    if nb_id in store:
+                        self._discard_neighbor(store.row_of[nb_id], node_id)
+                        touched.add(nb_id)
+                self._remove_node_row(node_id)
+                touched.discard(node_id)
+
+            for n in delta.get("add_nodes", ()):
+                if n["id"] in store:
+                    raise ValueError(f"Aynı ID'ye sahip node zaten var: {n['id']}")
+                self._append_node(Node(
+                    n["id"],
+                    n.get("name", f"Node {n['id']}"),
+                    n.get("aktiflik", 0.0),
+                    n.get("etkilesim", 0),
+                    n.get("baglanti_sayisi", 0)
+                ))
+                touched.add(n["id"])
+
+            for n in delta.get("update_nodes", ()):
+                node = store.get(n["id"])
+                if node is None:
+                    raise ValueError("Node bulunamadı")
+                self._save_row(node._row)
+                if n.get("name") is not None:
+                    node.name = n["name"]
+                if n.get("aktiflik") is not None:
+                    node.aktiflik = n["aktiflik"]
+                if n.get("etkilesim") is not None:
+                    node.etkilesim = n["etkilesim"]
+                updated.add(n["id"])
+
+            for u, v in map(self._delta_pair, delta.get("add_edges", ())):
+                if u == v:
+                    raise ValueError("Self-loop yasak")
+                if u not in store or v not in store:
+                    raise ValueError("Node bulunamadı")
+                if self._edge_key(u, v) in edge_index:
+                    raise ValueError("Bu edge zaten var")
+                edge = Edge(u, v, 0.0)
+                self._put_edge(edge)
+                self._add_neighbor(store.row_of[u], v)
+                self._add_neighbor(store.row_of[v], u)
+                touched.update((u, v))
+                added.append(edge)
+
+            for node_id in touched:
+                row = store.row_of[node_id]
+                self._save_row(row)
+                store.baglanti_sayisi[row] = store.komsular.degree(row)
+
+            # The new edges, then every edge next to an updated node.
+            edges = {self._edge_key(e.source, e.target): e for e in added}
+            for node_id in updated:
+                for nb_id in store.komsular[store.row_of[node_id]]:
+                    key = self._edge_key(node_id, nb_id)
+                    e = edge_index.get(key)
+                    if e is not None:
+                        edges[key] = e
+
+            edges = list(edges.values())
+            row_of = store.row_of
+            src_rows = array("q", (row_of[e.source] for e in edges))
+            dst_rows = array("q", (row_of[e.target] for e in edges))
+            changed = set(added)
+            for e, w in zip(edges, edge_weights(store, src_rows, dst_rows)):
+                if w != e.weight:
+                    self._set_weight(e, w)
+                    changed.add(e)
+
+            self._log("apply_delta", delta=delta)
+            self._mark_dirty()
+
+        return changed
+
+    @staticmethod
+    def _delta_pair(entry):
+        if isinstance(entry, dict):
+            return entry["from"], entry["to"]
+        u, v = entry
+        return u, v
+
     def calculate_weight(self, node1: Node, node2: Node):
         return 1 / (
             1
@@ -265,12 +1003,9 @@ class Graph:
 
     
     def edge_exists(self, source_id, target_id):
-        for e in self.edges:
-            if (e.source == source_id and e.target == target_id) or \
-               (e.source == target_id and e.target == source_id):
-                return True
-        return False
+        return self._edge_key(source_id, target_id) in self._edge_index
 
+    @_mutation
     def add_edge(self, source_id, target_id):
         if source_id == target_id:
             raise ValueError("Self-loop yasak")
@@ -285,44 +1020,32 @@ class Graph:
             raise ValueError("Bu edge zaten var")
 
         weight = self.calculate_weight(node1, node2)
-        self.edges.append(Edge(source_id, target_id, weight))
-
-        if target_id not in node1.komsular:
-            node1.komsular.append(target_id)
-        if source_id not in node2.komsular:
-            node2.komsular.append(source_id)
+        self._put_edge(Edge(source_id, target_id, weight))
 
-        node1.baglanti_sayisi = len(node1.komsular)
-        node2.baglanti_sayisi = len(node2.komsular)
+        for node, nb_id in ((node1, target_id), (node2, source_id)):
+            self._save_row(node._row)
+            self._add_neighbor(node._row, nb_id)
+            node.baglanti_sayisi = self._store.komsular.degree(node._row)
 
+        self._log("add_edge", source=source_id, target=target_id)
+        self._mark_dirty()
         self._autosave()
         
+    @_mutation
     def remove_edge(self, source_id, target_id):
-        removed = False
-        new_edges = []
-
-        for e in self.edges:
-            if (e.source == source_id and e.target == target_id) or (e.source == target_id and e.target == source_id):
-                removed = True
-            else:
-                new_edges.append(e)
-
-        if not removed:
+        if self._pop_edge(source_id, target_id) is None:
             raise ValueError("Edge bulunamadı")
 
-        self.edges = new_edges
-
-        n1 = self.get_node_by_id(source_id)
-        n2 = self.get_node_by_id(target_id)
-
-        if n1 and target_id in n1.komsular:
-            n1.komsular.remove(target_id)
-            n1.baglanti_sayisi = len(n1.komsular)
-
-        if n2 and source_id in n2.komsular:
-            n2.komsular.remove(source_id)
-            n2.baglanti_sayisi = len(n2.komsular)
+        for node_id, nb_id in ((source_id, target_id), (target_id, source_id)):
+            node = self.get_node_by_id(node_id)
+            if node is None:
+                continue
+            self._save_row(node._row)
+            if self._discard_neighbor(node._row, nb_id):
+                node.baglanti_sayisi = self._store.komsular.degree(node._row)
 
+        self._log("remove_edge", source=source_id, target=target_id)
+        self._mark_dirty()
         self._autosave()
 
 
@@ -406,13 +1129,8 @@ class Graph:
 
                 for nb_id in current_node.komsular:
                     # Check if edge satisfies threshold
-                    # We need to find the edge object to get the weight
-                    edge_w = 0
-                    for e in self.edges:
-                        if (e.source == current_id and e.target == nb_id) or \
-                           (e.source == nb_id and e.target == current_id):
-                            edge_w = e.weight
-                            break
+                    edge = self.get_edge(current_id, nb_id)
+                    edge_w = edge.weight if edge else 0
                     
                     if edge_w < threshold:
                         continue
@@ -436,50 +1154,57 @@ class Graph:
 
     
     def dijkstra(self, start_id, end_id):
-        if self.get_node_by_id(start_id) is None or self.get_node_by_id(end_id) is None:
-            raise ValueError("Başlangıç veya hedef node bulunamadı")
-
-        
-        distances = {node.id: float("inf") for node in self.nodes}
-        previous = {node.id: None for node in self.nodes}
-
-        distances[start_id] = 0
-        unvisited = set(distances.keys())
-
-        while unvisited:
-            current = min(unvisited, key=lambda node_id: distances[node_id])
-            unvisited.remove(current)
-
-            if current == end_id:
-                break
-
-            current_node = self.get_node_by_id(current)
-            for neighbor_id in current_node.komsular:
-                if neighbor_id not in unvisited:
-                    continue
-
-                neighbor_node = self.get_node_by_id(neighbor_id)
-                weight_val = self.calculate_weight(current_node, neighbor_node)
-                cost = 1.0 / weight_val if weight_val > 0 else float('inf')
-                
-                new_dist = distances[current] + cost
+        """
+        Shortest path by 1 / Edge.weight costs, using the shared heap-based
+        engine in algorithms/dijkstra.py over the compiled CSR snapshot.
+
+        The full shortest-path tree of start_id is kept in sssp_cache for
+        the current version, so later queries from the same start only walk
+        the predecessor array. Inside a batch (the version is not yet
+        bumped) or when a tree would not fit in the cache budget, the
+        cache is bypassed for a search that stops at the target.
+        """
+        with self._lock:
+            csr = self.compile()
+            if self._batch_depth or not self.sssp_cache.fits(csr):
+                return Dijkstra.run(csr, start_id, end_id)
+            version = self.version
 
-                if new_dist < distances[neighbor_id]:
-                    distances[neighbor_id] = new_dist
-                    previous[neighbor_id] = current
+        _, start, end = query_rows(csr, start_id, end_id)
+        return self.sssp_cache.tree(csr, start, version).path(end)
 
-        path = []
-        current = end_id
-        while current is not None:
-            path.insert(0, current)
-            current = previous[current]
+    def bidirectional_dijkstra(self, start_id, end_id):
+        """
+        Same (path, cost) as dijkstra(), searched from both ends until the
+        two frontiers meet; settles far fewer nodes on long queries.
+        """
+        return Dijkstra.run_bidirectional(self, start_id, end_id)
 
-        if path[0] != start_id:
-            raise ValueError("Bu iki node arasında yol yok")
+    def all_pairs(self, sources=None, method=None, workers=None):
+        """
+        DistanceMatrix of shortest-path costs from ``sources`` (default: all
+        nodes) to every node; see algorithms/all_pairs.py for the methods.
+        The full matrix is cached against self.version and also answers
+        later subset queries; nothing is cached inside a batch.
+        """
+        with self._lock:
+            cached = self._all_pairs
+            if (cached is not None and not self._batch_depth
+                    and cached.version == self.version
+                    and (sources is None or cached.covers(sources))):
+                return cached
+            csr = self.compile()
+            version = self.version
+            cacheable = sources is None and not self._batch_depth
+
+        # The CSR snapshot is immutable, so the heavy part runs unlocked.
+        result = DistanceMatrix.compute(csr, sources, method, workers, version=version)
+        if cacheable:
+            with self._lock:
+                if self.version == version and not self._batch_depth:
+                    self._all_pairs = result
+        return result
 
-        return path, distances[end_id]
-    
-       
     def heuristic(self, node1: Node, node2: Node):
         
         return (
@@ -488,52 +1213,47 @@ class Graph:
             + abs(node1.baglanti_sayisi - node2.baglanti_sayisi)
         )
 
-    def astar(self, start_id, end_id):
-        start_node = self.get_node_by_id(start_id)
-        end_node = self.get_node_by_id(end_id)
-
-        if start_node is None or end_node is None:
-            raise ValueError("Başlangıç veya hedef node bulunamadı")
-
-        open_set = {start_id}
-        came_from = {}
-
-        g_score = {node.id: float("inf") for node in self.nodes}
-        f_score = {node.id: float("inf") for node in self.nodes}
-
-        g_score[start_id] = 0
-        f_score[start_id] = self.heuristic(start_node, end_node)
-
-        while open_set:
-            current = min(open_set, key=lambda nid: f_score[nid])
-
-            if current == end_id:
-                path = [current]
-                while current in came_from:
-                    current = came_from[current]
-                    path.insert(0, current)
-                return path, g_score[end_id]
-
-            open_set.remove(current)
-            current_node = self.get_node_by_id(current)
-
-            for neighbor_id in current_node.komsular:
-                neighbor_node = self.get_node_by_id(neighbor_id)
-                
-                weight_val = self.calculate_weight(current_node, neighbor_node)
-                cost = 1.0 / weight_val if weight_val > 0 else float('inf')
-                
-                tentative_g = g_score[current] + cost
+    def astar(self, start_id, end_id, heuristic=None):
+        """
+        Heap-based A* (algorithms/a_star.py) over the compiled CSR snapshot.
+        ``heuristic(csr, target) -> h(row)`` can replace the default
+        admissible attribute heuristic; after build_landmarks() the
+        landmark (ALT) bounds are used instead, until the next mutation.
+        """
+        if heuristic is None:
+            index = self.landmark_index()
+            if index is not None:
+                heuristic = index.heuristic
+        return AStar.run(self, start_id, end_id, heuristic)
 
-                if tentative_g < g_score[neighbor_id]:
-                    came_from[neighbor_id] = current
-                    g_score[neighbor_id] = tentative_g
-                    f_score[neighbor_id] = tentative_g + self.heuristic(
-                        neighbor_node, end_node
-                    )
-                    open_set.add(neighbor_id)
+    def build_landmarks(self, k=8, strategy=FARTHEST):
+        """
+        Enables the ALT heuristic for astar() with k landmarks chosen by
+        farthest-point ("farthest") or degree ("degree") selection.
+        Building runs k full Dijkstra searches. k=0 switches it off again.
+        """
+        with self._lock:
+            index = LandmarkIndex(self.compile(), k, strategy) if k else None
+            self._landmarks = index
+            return index
 
-        raise ValueError("Bu iki node arasında yol yok")
+    def landmark_index(self):
+        """
+        The LandmarkIndex for the current snapshot, or None. The index is
+        not rebuilt behind the caller's back, since that would cost k full
+        Dijkstra searches on the first query after any edit: once the graph
+        changes it is dropped and astar() falls back to the attribute
+        heuristic until build_landmarks() is called again. None inside a
+        batch as well.
+        """
+        with self._lock:
+            index = self._landmarks
+            if index is None or self._batch_depth:
+                return None
+            if index.csr is not self.compile():
+                self._landmarks = None
+                return None
+            return index
     
     
     def welsh_powell(self, threshold=0.0):
@@ -562,13 +1282,8 @@ class Graph:
                     if color_of.get(komsu) == current_color:
                         # Check if the edge is 'active' based on threshold
                         # We need to verify weight.
-                        w = 0
-                        # Optimization: We could pre-index edges, but for N=100 iteration is fine.
-                        for e in self.edges:
-                             if (e.source == other.id and e.target == komsu) or \
-                                (e.source == komsu and e.target == other.id):
-                                 w = e.weight
-                                 break
+                        edge = self.get_edge(other.id, komsu)
+                        w = edge.weight if edge else 0
                         
                         if w >= threshold:
                             conflict = True
@@ -623,7 +1338,7 @@ class Graph:
                     disp[v][0] += (delta_x / dist) * force
                     disp[v][1] += (delta_y / dist) * force
 
-            for edge in self.edges:
+            for edge in self._edge_index.values():
                 v = edge.source
                 u = edge.target
                 if v not in positions or u not in positions: continue
@@ -0,0 +1,76 @@
+import json
+import os
+
+
+class MutationJournal:
+    """
+    Append-only log of graph mutations, one JSON record per line.
+
+    Every record carries an increasing ``seq`` number. A snapshot written by
+    compaction stores the last sequence number it contains, so records that
+    are already folded into the snapshot are skipped on replay even if the
+    process died before the log could be truncated.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def append(self, records):
+        if not records:
+            return
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+
+        self._file.write("".join(
+            json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for r in records
+        ))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def read(self, after_seq=0):
+        """
+        Yields the records with seq > after_seq. A torn last record (crash in
+        the middle of a write) is cut off so later appends start on a clean line.
+        """
+        if not os.path.exists(self.path):
+            return
+        good_end = 0
+        torn = False
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated record")
+                    record = json.loads(line) if line.strip() else None
+                except ValueError:
+                    torn = True
+                    break
+                good_end += len(line)
+                if record is not None and record.get("seq", 0) > after_seq:
+                    yield record
+
+        if torn:
+            self.close()
+            with open(self.path, "r+b") as f:
+                f.truncate(good_end)
+
+    def size(self):
+        if self._file is not None:
+            return self._file.tell()
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def truncate(self):
+        self.close()
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.flush()
+            os.fsync(f.fileno())
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
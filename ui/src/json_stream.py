@@ -0,0 +1,151 @@
+import json
+
+_COMPACT = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_PRETTY = json.JSONEncoder(ensure_ascii=False, indent=4)
+
+# Element indent inside the top-level arrays when pretty printing.
+_ITEM_INDENT = " " * 8
+
+
+def node_rows(store):
+    """(id, name, aktiflik, etkilesim, baglanti_sayisi, komsular) per NodeStore row."""
+    return zip(store.ids, store.names, store.aktiflik, store.etkilesim,
+               store.baglanti_sayisi, store.komsular)
+
+
+def edge_rows(edges):
+    return ((e.source, e.target, e.weight) for e in edges)
+
+
+def write_graph(f, nodes, edges, journal_seq=None, pretty=False):
+    """
+    Writes a graph.json document element by element, so only one node or
+    edge is encoded at a time. ``nodes`` yields node_rows() tuples, ``edges``
+    yields (source, target, weight). Compact output puts one element per
+    line; ``pretty=True`` gives the same text as ``json.dump(..., indent=4)``.
+    """
+    encode = _PRETTY.encode if pretty else _COMPACT.encode
+
+    f.write('{\n    "nodes": ' if pretty else '{"nodes":')
+    _write_array(f, (
+        {
+            "id": nid,
+            "name": name,
+            "aktiflik": aktiflik,
+            "etkilesim": etkilesim,
+            "baglanti_sayisi": baglanti_sayisi,
+            "komsular": list(komsular)
+        }
+        for nid, name, aktiflik, etkilesim, baglanti_sayisi, komsular in nodes
+    ), encode, pretty)
+
+    f.write(',\n    "edges": ' if pretty else ',"edges":')
+    _write_array(f, (
+        {"from": u, "to": v, "weight": w} for u, v, w in edges
+    ), encode, pretty)
+
+    if journal_seq is not None:
+        f.write(f',\n    "journal_seq": {journal_seq}' if pretty else f',"journal_seq":{journal_seq}')
+    f.write("\n}" if pretty else "}\n")
+
+
+def _write_array(f, items, encode, pretty):
+    first = True
+    for item in items:
+        text = encode(item)
+        if pretty:
+            text = _ITEM_INDENT + text.replace("\n", "\n" + _ITEM_INDENT)
+        f.write(("[\n" if first else ",\n") + text)
+        first = False
+
+    if first:
+        f.write("[]")
+    else:
+        f.write("\n    ]" if pretty else "\n]")
+
+
+class _Reader:
+    """Character buffer over a text file that is refilled on demand."""
+
+    def __init__(self, f, chunk_size):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character without consuming it ("" at end of file)."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def take(self, expected):
+        char = self.peek()
+        if char not in expected:
+            raise ValueError(f"Geçersiz JSON: '{expected}' bekleniyordu, '{char}' bulundu")
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number that touches the end of the buffer may continue in the next chunk.
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_graph(f, chunk_size=1 << 16):
+    """
+    Parses a graph.json document incrementally. Elements of the top-level
+    ``nodes`` and ``edges`` arrays are yielded one by one as
+    ``("nodes", dict)`` / ``("edges", dict)``; any other top-level key is
+    yielded whole as ``(key, value)``. Memory use does not grow with the
+    number of elements.
+    """
+    reader = _Reader(f, chunk_size)
+    reader.take("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.value()
+        reader.take(":")
+        if key in ("nodes", "edges") and reader.peek() == "[":
+            reader.take("[")
+            if reader.peek() == "]":
+                reader.take("]")
+            else:
+                while True:
+                    yield key, reader.value()
+                    if reader.take(",]") == "]":
+                        break
+        else:
+            yield key, reader.value()
+
+        if reader.take(",}") == "}":
+            return
@@ -0,0 +1,111 @@
+import hashlib
+import os
+
+from . import binary_store
+from .autosave import atomic_write
+
+DEFAULT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "yazlab2")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class LoadCache:
+    """
+    Cache of parsed, weighted graphs in the binary snapshot format.
+
+    Entries are keyed by the absolute source path plus its size and mtime
+    (or, with ``hash_content=True``, a hash of its bytes), so an edited
+    file is a miss. The directory is kept under ``max_bytes`` by evicting
+    the least recently used entries; a hit refreshes the entry's mtime.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES, hash_content=False):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hash_content = hash_content
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, path):
+        st = os.stat(path)
+        h = hashlib.blake2b(digest_size=16)
+        h.update(os.path.abspath(path).encode("utf-8"))
+        h.update(f"\0{st.st_size}".encode())
+        if self.hash_content:
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+        else:
+            h.update(f"\0{st.st_mtime_ns}".encode())
+        return h.hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.cache_dir, key + binary_store.BINARY_EXT)
+
+    def lookup(self, key):
+        """Path of the cached snapshot for key, or None."""
+        entry = self._entry(key)
+        try:
+            os.utime(entry)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def store(self, key, graph):
+        """Writes graph under key; graphs the binary format cannot hold are skipped."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with graph._lock:
+            try:
+                snapshot = binary_store.collect(graph)
+            except ValueError:
+                return None
+        entry = self._entry(key)
+        atomic_write(entry, lambda f: binary_store.write(f, snapshot), mode="wb")
+        self.evict()
+        return entry
+
+    def discard(self, key):
+        try:
+            os.unlink(self._entry(key))
+        except OSError:
+            pass
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(binary_store.BINARY_EXT):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(binary_store.BINARY_EXT):
+                os.unlink(os.path.join(self.cache_dir, name))
+
+
+_default = None
+
+
+def default_cache():
+    global _default
+    if _default is None:
+        _default = LoadCache()
+    return _default
@@ -8,7 +8,7 @@ from PyQt5.QtWidgets import (
     QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsLineItem,
     QFrame, QTableWidget, QTableWidgetItem, QHeaderView,
     QSizePolicy, QGraphicsTextItem, QScrollArea, QGraphicsItem, QComboBox, QFileDialog,
-    QStackedWidget
+    QStackedWidget, QProgressDialog
 )
 from PyQt5.QtGui import QBrush, QPen, QPainter, QColor, QFont, QRadialGradient
 from PyQt5.QtCore import Qt, QPointF, pyqtSignal
@@ -16,6 +16,7 @@ from PyQt5.QtCore import Qt, QPointF, pyqtSignal
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from ui.src.graph import Graph
+from ui.src import sparse_export
 from ui.src.node import Node
 from ui.src.edge import Edge
 from ui.src.styles import (
@@ -99,27 +100,37 @@ class EdgeItem(QGraphicsLineItem):
     def __init__(self, edge, p1: QPointF, p2: QPointF, color=None):
         super().__init__(p1.x(), p1.y(), p2.x(), p2.y())
         self.setZValue(-1)
+        self.edge = edge
+        self.color = color if color else COLORS["text_muted"]
+        
+        self.setAcceptHoverEvents(True)
+
+        self.text = QGraphicsTextItem("", self)
+        self.text.setDefaultTextColor(QColor("#a5b4fc")) # Light Indigo
+        font = QFont("Arial", 9)
+        self.text.setFont(font)
+
+        self.refresh()
+
+    def refresh(self):
+        # Re-reads the edge weight; used after update_node changes it.
+        edge = self.edge
         w = max(1, min(6, edge.weight * 3))
         
-        c = color if color else COLORS["text_muted"]
-        pen = QPen(QColor(c), w)
+        pen = QPen(QColor(self.color), w)
         pen.setCapStyle(Qt.RoundCap)
         self.setPen(pen)
         
-        self.setAcceptHoverEvents(True)
         self.setToolTip(f"Edge: {edge.source}-{edge.target}\nAğırlık: {edge.weight:.4f}")
 
-        mid_x = (p1.x() + p2.x()) / 2
-        mid_y = (p1.y() + p2.y()) / 2
+        line = self.line()
+        mid_x = (line.x1() + line.x2()) / 2
+        mid_y = (line.y1() + line.y2()) / 2
         
-        self.text = QGraphicsTextItem(f"{edge.weight:.2f}", self)
+        self.text.setPlainText(f"{edge.weight:.2f}")
         rect = self.text.boundingRect()
         self.text.setPos(mid_x - rect.width()/2, mid_y - rect.height()/2)
         
-        self.text.setDefaultTextColor(QColor("#a5b4fc")) # Light Indigo
-        font = QFont("Arial", 9)
-        self.text.setFont(font)
-        
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -227,7 +238,11 @@ class MainWindow(QMainWindow):
         b_load.clicked.connect(self.load_csv_dialog)
         p2.add_widget(b_load)
 
-        b_export_mat = GlossyButton("📤 Matris Çıktısı (CSV)")
+        b_delta = GlossyButton("🔁 Değişiklik Uygula (Delta)")
+        b_delta.clicked.connect(self.apply_delta_dialog)
+        p2.add_widget(b_delta)
+
+        b_export_mat = GlossyButton("📤 Matris Çıktısı")
         b_export_mat.clicked.connect(self.export_matrix_dialog)
         p2.add_widget(b_export_mat)
         
@@ -296,7 +311,7 @@ class MainWindow(QMainWindow):
         
         self.panel_settings.add_widget(QLabel("Algoritma:"))
         self.algo_combo = QComboBox()
-        self.algo_combo.addItems(["Dijkstra", "A*", "BFS", "DFS"])
+        self.algo_combo.addItems(["Dijkstra", "Çift Yönlü Dijkstra", "A*", "BFS", "DFS"])
         self.algo_combo.setStyleSheet(INPUT_STYLE)
         self.panel_settings.add_widget(self.algo_combo)
 
@@ -486,13 +501,20 @@ class MainWindow(QMainWindow):
             act = float(self.edit_act.text())
             inter = int(self.edit_int.text())
             
-            self.graph.update_node(nid, name=name, aktiflik=act, etkilesim=inter)
-            self.draw_graph()
-            
-            for item in self.scene.items():
-                if isinstance(item, NodeItem) and item.node.id == nid:
-                    item.setSelected(True)
-                    break
+            changed = self.graph.update_node(nid, name=name, aktiflik=act, etkilesim=inter)
+
+            if self.is_colored or self.community_threshold > 0:
+                # Colours and threshold filtering depend on weights, redraw everything.
+                self.draw_graph()
+
+                for item in self.scene.items():
+                    if isinstance(item, NodeItem) and item.node.id == nid:
+                        item.setSelected(True)
+                        break
+            else:
+                for item in self.scene.items():
+                    if isinstance(item, EdgeItem) and item.edge in changed:
+                        item.refresh()
 
             QMessageBox.information(self, "Başarılı", "Güncellendi")
         except Exception as e:
@@ -551,7 +573,7 @@ class MainWindow(QMainWindow):
             result_msg = ""
             results_for_table = [] 
             
-            if algo_type in ["Dijkstra", "A*"]:
+            if algo_type in ["Dijkstra", "Çift Yönlü Dijkstra", "A*"]:
                 if target_id is None:
                     QMessageBox.warning(self, "Uyarı", f"{algo_type} için Hedef Node ID giriniz.")
                     return
@@ -559,6 +581,9 @@ class MainWindow(QMainWindow):
                 if algo_type == "Dijkstra":
                     path, cost = self.graph.dijkstra(start_id, target_id)
                     title = "Dijkstra"
+                elif algo_type == "Çift Yönlü Dijkstra":
+                    path, cost = self.graph.bidirectional_dijkstra(start_id, target_id)
+                    title = "Çift Yönlü Dijkstra"
                 else: 
                     path, cost = self.graph.astar(start_id, target_id)
                     title = "A*"
@@ -613,7 +638,7 @@ class MainWindow(QMainWindow):
 
         
     def save_graph(self):
-        self.graph.save_to_json(self.graph.data_path)
+        self.graph.save(self.graph.data_path)
         QMessageBox.information(self, "Kayıt", "Kaydedildi.")
 
     def open_dashboard(self):
@@ -636,13 +661,18 @@ class MainWindow(QMainWindow):
     def close_dashboard(self):
         self.stack.setCurrentIndex(0)
 
+    def closeEvent(self, event):
+        # Make sure a pending background autosave reaches the disk.
+        self.graph.close()
+        super().closeEvent(event)
+
     def revert_graph(self):
         try:
             if not os.path.exists(self.graph.data_path):
                 QMessageBox.warning(self, "Hata", "Kayıtlı dosya bulunamadı.")
                 return
             
-            self.graph.load_from_json(self.graph.data_path)
+            self.graph.load_cached(self.graph.data_path)
             self.is_colored = False
             self.community_threshold = 0.0
             self.highlight_nodes.clear()
@@ -653,10 +683,23 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Hata", str(e))
 
     def load_csv_dialog(self):
-        path, _ = QFileDialog.getOpenFileName(self, "CSV Yükle", "", "CSV Files (*.csv)")
-        if path:
+        paths, _ = QFileDialog.getOpenFileNames(self, "CSV Yükle", "", "CSV Files (*.csv)")
+        if paths:
             try:
-                self.graph.load_from_csv(path)
+                progress = QProgressDialog("CSV yükleniyor...", None, 0, 100, self)
+                progress.setWindowModality(Qt.WindowModal)
+                progress.setMinimumDuration(500)
+
+                def on_progress(done, total):
+                    progress.setValue(int(done * 100 / total) if total else 100)
+                    QApplication.processEvents()
+
+                if len(paths) == 1:
+                    self.graph.load_cached(paths[0], progress=on_progress)
+                else:
+                    # Several shards: parsed in parallel, merged into one graph.
+                    self.graph.import_csv_shards(paths, progress=on_progress)
+                progress.close()
                 self.is_colored = False
                 self.community_threshold = 0.0 
                 self.highlight_nodes.clear()
@@ -666,11 +709,29 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.warning(self, "Hata", str(e))
 
+    def apply_delta_dialog(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Delta Uygula", "", "JSON Files (*.json)")
+        if path:
+            try:
+                self.graph.apply_delta(path)
+                self.draw_graph()
+                QMessageBox.information(self, "Başarılı", "Değişiklikler uygulandı.")
+            except Exception as e:
+                QMessageBox.warning(self, "Hata", str(e))
+
     def export_matrix_dialog(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Matris Kaydet", "adjacency_matrix.csv", "CSV Files (*.csv)")
+        filters = {
+            "Kenar Listesi / COO (*.csv)": sparse_export.COO,
+            "Matrix Market (*.mtx)": sparse_export.MATRIX_MARKET,
+            "CSR - scipy (*.npz)": sparse_export.CSR_NPZ,
+            "Yoğun Matris CSV (*.csv)": sparse_export.DENSE,
+        }
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Matris Kaydet", "adjacency.csv", ";;".join(filters)
+        )
         if path:
             try:
-                self.graph.export_adjacency_matrix(path)
+                self.graph.export_adjacency(path, filters.get(selected))
                 QMessageBox.information(self, "Başarılı", "Komşuluk matrisi kaydedildi.")
             except Exception as e:
                 QMessageBox.warning(self, "Hata", str(e))
@@ -1,4 +1,667 @@
+import operator
+import weakref
+from array import array
+from contextlib import contextmanager
+from itertools import accumulate
+
+
+
+
+class NeighborSet:
+    """
+    Insertion-ordered set of neighbour ids.
+
+    Membership, add and remove are O(1) (it is backed by a dict), while
+    iteration keeps the order the neighbours were added in. ``append`` and
+    ``remove`` behave like their list counterparts so older call sites keep
+    working; use ``list(...)`` to serialise it.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, ids=()):
+        self._items = dict.fromkeys(ids)
+
+    def __contains__(self, node_id):
+        return node_id in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __eq__(self, other):
+        if isinstance(other, NeighborSet):
+            other = list(other._items)
+        if isinstance(other, list):
+            return list(self._items) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def add(self, node_id):
+        self._items[node_id] = None
+
+    append = add
+
+    def discard(self, node_id):
+        self._items.pop(node_id, None)
+
+    def remove(self, node_id):
+        try:
+            del self._items[node_id]
+        except KeyError:
+            raise ValueError(f"{node_id} komşu listesinde yok") from None
+
+    def __repr__(self):
+        return f"NeighborSet({list(self._items)})"
+
+
+class IdIndex:
+    """
+    Node id -> row number.
+
+    While the ids are dense integers (the usual 1..n) this is one flat
+    array('q') indexed by ``id - base``, 8 bytes per id, with -1 marking
+    unused slots. Once the ids get too sparse for that it becomes a dict.
+    """
+
+    __slots__ = ("_table", "_base", "_count", "_dict")
+
+    # The table may span this many slots per id (plus _SLACK) before it
+    # is given up for a dict.
+    _SPREAD = 2
+    _SLACK = 1024
+
+    def __init__(self):
+        self._table = array("q")
+        self._base = 0
+        self._count = 0
+        self._dict = None
+
+    @classmethod
+    def from_ids(cls, ids):
+        """Index of ``ids[row] -> row``, a table whenever the ids allow it."""
+        index = cls()
+        if len(ids):
+            lo, hi = min(ids), max(ids)
+            if hi - lo < cls._SPREAD * len(ids) + cls._SLACK:
+                index._base = lo
+                index._table = array("q", [-1]) * (hi - lo + 1)
+        for row, node_id in enumerate(ids):
+            index[node_id] = row
+        return index
+
+    @property
+    def dense(self):
+        return self._dict is None
+
+    def __len__(self):
+        return self._count if self._dict is None else len(self._dict)
+
+    def __contains__(self, node_id):
+        return self.get(node_id) is not None
+
+    def __getitem__(self, node_id):
+        row = self.get(node_id)
+        if row is None:
+            raise KeyError(node_id)
+        return row
+
+    def get(self, node_id, default=None):
+        if self._dict is not None:
+            return self._dict.get(node_id, default)
+        try:
+            row = self._table[node_id - self._base] if node_id >= self._base else -1
+        except (TypeError, IndexError):
+            return default
+        return row if row >= 0 else default
+
+    def __setitem__(self, node_id, row):
+        if self._dict is None and not self._cover(node_id):
+            self._dict = {self._base + i: r for i, r in enumerate(self._table) if r >= 0}
+            self._table = array("q")
+        if self._dict is not None:
+            self._dict[node_id] = row
+            return
+        i = node_id - self._base
+        if self._table[i] < 0:
+            self._count += 1
+        self._table[i] = row
+
+    def pop(self, node_id):
+        row = self[node_id]
+        if self._dict is not None:
+            del self._dict[node_id]
+        else:
+            self._table[node_id - self._base] = -1
+            self._count -= 1
+        return row
+
+    def _cover(self, node_id):
+        """Grows the table to cover node_id; False if it would get too sparse."""
+        if type(node_id) is not int:
+            return False
+        table = self._table
+        if not table:
+            self._base = node_id
+            self._table = array("q", [-1])
+            return True
+        lo, hi = self._base, self._base + len(table)
+        if lo <= node_id < hi:
+            return True
+        span = max(hi, node_id + 1) - min(lo, node_id)
+        if span > self._SPREAD * (self._count + 1) + self._SLACK:
+            return False
+        # Half the span again on the growing side keeps appends amortised O(1).
+        if node_id < lo:
+            new_lo = node_id - span // 2
+            self._table = array("q", [-1]) * (lo - new_lo) + table
+            self._base = new_lo
+        else:
+            table.extend(array("q", [-1]) * (node_id + 1 + span // 2 - hi))
+        return True
+
+
+class StringColumn:
+    """
+    The strings of every row packed into one utf-8 blob: row i is
+    ``data[starts[i]:starts[i] + lengths[i]]``. Overwritten and removed
+    strings stay behind as garbage until the blob is compacted.
+    """
+
+    __slots__ = ("data", "starts", "lengths", "auto_compact", "_garbage")
+
+    _MIN_GARBAGE = 1 << 16
+
+    def __init__(self):
+        self.data = bytearray()
+        self.starts = array("q")
+        self.lengths = array("i")
+        self.auto_compact = True
+        self._garbage = 0
+
+    @classmethod
+    def from_blob(cls, blob, offsets):
+        """Column over a utf-8 blob and its len(rows) + 1 offsets (the binary snapshot layout)."""
+        column = cls()
+        column.data = bytearray(blob)
+        column.starts.frombytes(memoryview(offsets)[:-1].cast("B"))
+        column.lengths = array("i", map(operator.sub, offsets[1:], offsets[:-1]))
+        return column
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, row):
+        start = self.starts[row]
+        return self.data[start:start + self.lengths[row]].decode("utf-8")
+
+    def __iter__(self):
+        data = self.data
+        for start, length in zip(self.starts, self.lengths):
+            yield data[start:start + length].decode("utf-8")
+
+    def __setitem__(self, row, value):
+        raw = str(value).encode("utf-8")
+        self._garbage += self.lengths[row]
+        self.starts[row] = len(self.data)
+        self.lengths[row] = len(raw)
+        self.data += raw
+        self._maybe_compact()
+
+    def append(self, value):
+        raw = str(value).encode("utf-8")
+        self.starts.append(len(self.data))
+        self.lengths.append(len(raw))
+        self.data += raw
+
+    def swap(self, a, b):
+        starts, lengths = self.starts, self.lengths
+        starts[a], starts[b] = starts[b], starts[a]
+        lengths[a], lengths[b] = lengths[b], lengths[a]
+
+    def pop(self):
+        self.starts.pop()
+        self._garbage += self.lengths.pop()
+        self._maybe_compact()
+
+    def copy(self):
+        column = StringColumn()
+        column.data = bytearray(self.data)
+        column.starts = array("q", self.starts)
+        column.lengths = array("i", self.lengths)
+        column._garbage = self._garbage
+        return column
+
+    def blob(self):
+        """(offsets, bytes) with the rows packed in order, the binary snapshot layout."""
+        data = self.data
+        packed = b"".join(data[s:s + n] for s, n in zip(self.starts, self.lengths))
+        return array("q", accumulate(self.lengths, initial=0)), packed
+
+    def compact(self):
+        if not self._garbage and self.starts == array("q", accumulate(self.lengths, initial=0))[:-1]:
+            return
+        offsets, packed = self.blob()
+        self.data = bytearray(packed)
+        self.starts = offsets[:-1]
+        self._garbage = 0
+
+    def _maybe_compact(self):
+        if self.auto_compact and self._garbage > max(self._MIN_GARBAGE, len(self.data) // 2):
+            self.compact()
+
+
+class NeighborColumn:
+    """
+    The neighbour ids of every row in one flat array('q'): row i is
+    ``targets[starts[i]:starts[i] + lengths[i]]``, 8 bytes per neighbour.
+
+    Short rows are searched in place. A row that is edited (or searched
+    while long) moves into a NeighborSet, which makes later membership
+    tests, adds and discards O(1); compact() packs every row back into the
+    flat array once many rows have moved. Rows read as lists in insertion
+    order.
+    """
+
+    __slots__ = ("targets", "starts", "lengths", "auto_compact", "_sets", "_garbage")
+
+    # Rows up to this long are scanned instead of being moved to a set.
+    _SCAN = 16
+    _MIN_SETS = 1024
+
+    def __init__(self):
+        self.targets = array("q")
+        self.starts = array("q")
+        self.lengths = array("i")
+        self.auto_compact = True
+        self._sets = {}
+        self._garbage = 0
+
+    @classmethod
+    def from_flat(cls, targets, offsets):
+        """Column over CSR-like buffers: row i is ``targets[offsets[i]:offsets[i + 1]]``."""
+        column = cls()
+        column.targets.frombytes(memoryview(targets).cast("B"))
+        column.starts.frombytes(memoryview(offsets)[:-1].cast("B"))
+        column.lengths = array("i", map(operator.sub, offsets[1:], offsets[:-1]))
+        return column
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, row):
+        """The neighbours of row as a new list."""
+        s = self._sets.get(row)
+        if s is not None:
+            return list(s)
+        start = self.starts[row]
+        return self.targets[start:start + self.lengths[row]].tolist()
+
+    def __iter__(self):
+        targets, sets = self.targets, self._sets
+        for row, (start, length) in enumerate(zip(self.starts, self.lengths)):
+            s = sets.get(row) if sets else None
+            yield list(s) if s is not None else targets[start:start + length].tolist()
+
+    def degree(self, row):
+        s = self._sets.get(row)
+        return len(s) if s is not None else self.lengths[row]
+
+    def contains(self, row, node_id):
+        s = self._sets.get(row)
+        if s is None:
+            length = self.lengths[row]
+            if length <= self._SCAN:
+                start = self.starts[row]
+                return node_id in self.targets[start:start + length]
+            s = self._promote(row)
+        return node_id in s
+
+    def add(self, row, node_id):
+        """Adds node_id to the row; False if it was already there."""
+        s = self._sets.get(row)
+        if s is None:
+            if self.contains(row, node_id):
+                return False
+            s = self._set(row)
+        elif node_id in s:
+            return False
+        s.add(node_id)
+        return True
+
+    def discard(self, row, node_id):
+        """Removes node_id from the row; False if it was not there."""
+        if not self.contains(row, node_id):
+            return False
+        self._set(row).discard(node_id)
+        return True
+
+    def set(self, row, node_ids):
+        self._set(row)
+        self._sets[row] = NeighborSet(node_ids)
+
+    def append(self, node_ids=()):
+        start = len(self.targets)
+        if node_ids:
+            self.targets.extend(dict.fromkeys(node_ids))
+        self.starts.append(start)
+        self.lengths.append(len(self.targets) - start)
+
+    def extend(self, rows, node_ids):
+        """
+        Appends node_ids[k] to row rows[k] for every k, in order, laying
+        every row out again in one pass. The pairs must be new: nothing is
+        checked for duplicates. For loaders that collect a whole adjacency
+        before storing it.
+        """
+        self.compact()
+        lengths, starts, targets = self.lengths, self.starts, self.targets
+        added = array("i", [0]) * len(starts)
+        for row in rows:
+            added[row] += 1
+        new_lengths = array("i", map(operator.add, lengths, added))
+        new_starts = array("q", accumulate(new_lengths, initial=0))
+
+        packed = array("q", [0]) * new_starts[-1]
+        fill = array("q", new_starts)
+        for row, (start, length) in enumerate(zip(starts, lengths)):
+            if length:
+                packed[fill[row]:fill[row] + length] = targets[start:start + length]
+                fill[row] += length
+        for row, node_id in zip(rows, node_ids):
+            packed[fill[row]] = node_id
+            fill[row] += 1
+
+        self.targets = packed
+        self.starts = new_starts[:-1]
+        self.lengths = new_lengths
+
+    def swap(self, a, b):
+        starts, lengths, sets = self.starts, self.lengths, self._sets
+        starts[a], starts[b] = starts[b], starts[a]
+        lengths[a], lengths[b] = lengths[b], lengths[a]
+        set_a, set_b = sets.pop(a, None), sets.pop(b, None)
+        if set_a is not None:
+            sets[b] = set_a
+        if set_b is not None:
+            sets[a] = set_b
+
+    def pop(self):
+        self._sets.pop(len(self.starts) - 1, None)
+        self.starts.pop()
+        self._garbage += self.lengths.pop()
+        self._maybe_compact()
+
+    def copy(self):
+        column = NeighborColumn()
+        column.targets = array("q", self.targets)
+        column.starts = array("q", self.starts)
+        column.lengths = array("i", self.lengths)
+        column._sets = {row: NeighborSet(s) for row, s in self._sets.items()}
+        column._garbage = self._garbage
+        return column
+
+    def flat(self):
+        """(offsets, targets) copies with the rows packed in order, like a CSR."""
+        self.compact()
+        return array("q", accumulate(self.lengths, initial=0)), array("q", self.targets)
+
+    def compact(self):
+        """Packs every row, sets included, back into the flat array in row order."""
+        starts, lengths, targets, sets = self.starts, self.lengths, self.targets, self._sets
+        if not sets and not self._garbage and starts == array("q", accumulate(lengths, initial=0))[:-1]:
+            return
+
+        packed = array("q")
+        new_starts = array("q")
+        for row, start in enumerate(starts):
+            new_starts.append(len(packed))
+            s = sets.get(row) if sets else None
+            if s is None:
+                packed += targets[start:start + lengths[row]]
+            else:
+                packed.extend(s)
+                lengths[row] = len(s)
+
+        self.targets = packed
+        self.starts = new_starts
+        self._sets = {}
+        self._garbage = 0
+
+    def _set(self, row):
+        s = self._sets.get(row)
+        return s if s is not None else self._promote(row)
+
+    def _promote(self, row):
+        if self.auto_compact and len(self._sets) >= max(self._MIN_SETS, len(self.starts) // 8):
+            self.compact()
+        start, length = self.starts[row], self.lengths[row]
+        s = NeighborSet(self.targets[start:start + length] if length else ())
+        self._sets[row] = s
+        self.lengths[row] = 0
+        self._garbage += length
+        return s
+
+    def _maybe_compact(self):
+        if self.auto_compact and self._garbage > max(1 << 16, len(self.targets) // 2):
+            self.compact()
+
+
+class _ViewRef(weakref.ref):
+    __slots__ = ("row",)
+
+
+class NodeStore:
+    """
+    Columnar (struct-of-arrays) storage for nodes.
+
+    Ids and numeric attributes live in typed arrays, names in one utf-8
+    blob and neighbour lists in one flat id array, so a row costs a few
+    dozen bytes plus 8 per neighbour rather than a handful of Python
+    objects. Node objects are thin views over a row, created on demand;
+    the store only keeps weak references to the views still in use, so a
+    row has at most one live view and that view follows the row.
+    """
+
+    def __init__(self):
+        self.ids = array("q")
+        self.names = StringColumn()
+        self.aktiflik = array("d")
+        self.etkilesim = array("q")
+        self.baglanti_sayisi = array("q")
+        self.komsular = NeighborColumn()
+
+        self.row_of = IdIndex()
+        # row -> weak reference to the live view of that row
+        self._views = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, node_id):
+        return node_id in self.row_of
+
+    def append(self, node_id, name, aktiflik=0.0, etkilesim=0, baglanti_sayisi=0, komsular=None):
+        row = len(self.ids)
+        # Convert first so a bad value leaves every column untouched.
+        aktiflik, etkilesim, baglanti_sayisi = float(aktiflik), int(etkilesim), int(baglanti_sayisi)
+        self.ids.append(node_id)
+        self.names.append(name)
+        self.aktiflik.append(aktiflik)
+        self.etkilesim.append(etkilesim)
+        self.baglanti_sayisi.append(baglanti_sayisi)
+        self.komsular.append(() if komsular is None else komsular)
+        self.row_of[node_id] = row
+        return row
+
+    @classmethod
+    def from_columns(cls, ids, names, aktiflik, etkilesim, baglanti_sayisi, komsular):
+        """
+        Builds a store from whole columns at once. ``names`` is a
+        StringColumn and ``komsular`` a NeighborColumn; the other columns
+        may be any buffer (e.g. memoryviews over a binary snapshot) and
+        are copied.
+        """
+        store = cls()
+        for column, data in ((store.ids, ids), (store.aktiflik, aktiflik),
+                             (store.etkilesim, etkilesim), (store.baglanti_sayisi, baglanti_sayisi)):
+            column.frombytes(memoryview(data).cast("B"))
+        store.names = names
+        store.komsular = komsular
+        store.row_of = IdIndex.from_ids(store.ids)
+        return store
+
+    @contextmanager
+    def bulk(self):
+        """
+        For loaders: while rows are appended and edited in bulk, ids are
+        looked up in a plain dict and nothing is compacted; the index is
+        rebuilt and the columns packed once at the end.
+        """
+        self.names.auto_compact = self.komsular.auto_compact = False
+        self.row_of = {node_id: row for row, node_id in enumerate(self.ids)}
+        try:
+            yield self
+        finally:
+            self.names.auto_compact = self.komsular.auto_compact = True
+            self.row_of = IdIndex.from_ids(self.ids)
+        self.compact()
+
+    def compact(self):
+        """Packs the name and neighbour columns and re-densifies the id index."""
+        self.names.compact()
+        self.komsular.compact()
+        if not self.row_of.dense:
+            self.row_of = IdIndex.from_ids(self.ids)
+
+    # True for the one-row store a stand-alone Node owns; only such nodes
+    # may be adopted by attach().
+    private = False
+
+    @classmethod
+    def detach(cls, node):
+        """Moves node into a private one-row store holding a copy of its row."""
+        store = cls()
+        store.private = True
+        store.attach(node, adopt=True)
+        return store
+
+    def attach(self, node, adopt=None):
+        """
+        Copies a node's row into this store. A node that owns a private
+        store is rebound to the new row; a live view of another store is
+        only copied, so it keeps reading and writing its own store.
+        """
+        row = self.append(
+            node.id, node.name, node.aktiflik, node.etkilesim,
+            node.baglanti_sayisi, node.komsular
+        )
+        if adopt is None:
+            adopt = node._store.private
+        if adopt:
+            node._store = self
+            node._row = row
+            self._track(row, node)
+        return row
+
+    def view(self, row):
+        node = self._live_view(row)
+        if node is None:
+            node = Node.__new__(Node)
+            node._store = self
+            node._row = row
+            self._track(row, node)
+        return node
+
+    def get(self, node_id):
+        row = self.row_of.get(node_id)
+        if row is None:
+            return None
+        return self.view(row)
+
+    def views(self):
+        return [self.view(row) for row in range(len(self.ids))]
+
+    def remove(self, node_id):
+        """
+        Removes a row by swapping the last row into its place (O(1)).
+        A live view of the removed row is detached into its own store, so
+        callers holding it still see the old values.
+        """
+        row = self.row_of[node_id]
+        node = self._untrack(row)
+        if node is not None:
+            NodeStore.detach(node)
+
+        last = len(self.ids) - 1
+        if row != last:
+            self._swap(row, last)
+        self.row_of.pop(node_id)
+        for column in (self.ids, self.names, self.aktiflik, self.etkilesim,
+                       self.baglanti_sayisi, self.komsular):
+            column.pop()
+
+    def reinsert(self, row, node_id, name, aktiflik, etkilesim, baglanti_sayisi, komsular, view=None):
+        """
+        Undoes remove(): the row now at ``row`` moves back to the end and the
+        node takes its old place again. Its old view is re-bound unless it
+        has been adopted by another store in the meantime.
+        """
+        if view is not None and not view._store.private:
+            view = None
+        last = self.append(node_id, name, aktiflik, etkilesim, baglanti_sayisi, komsular)
+        if row != last:
+            self._swap(row, last)
+        if view is not None:
+            view._store = self
+            view._row = row
+            self._track(row, view)
+
+    def _swap(self, a, b):
+        for column in (self.ids, self.aktiflik, self.etkilesim, self.baglanti_sayisi):
+            column[a], column[b] = column[b], column[a]
+        self.names.swap(a, b)
+        self.komsular.swap(a, b)
+        self.row_of[self.ids[a]] = a
+        self.row_of[self.ids[b]] = b
+
+        view_a, view_b = self._untrack(a), self._untrack(b)
+        if view_a is not None:
+            view_a._row = b
+            self._track(b, view_a)
+        if view_b is not None:
+            view_b._row = a
+            self._track(a, view_b)
+
+    def _live_view(self, row):
+        ref = self._views.get(row)
+        return ref() if ref is not None else None
+
+    def _track(self, row, node):
+        ref = _ViewRef(node, self._forget)
+        ref.row = row
+        self._views[row] = ref
+
+    def _untrack(self, row):
+        ref = self._views.pop(row, None)
+        return ref() if ref is not None else None
+
+    def _forget(self, ref):
+        # Called when a view is garbage collected.
+        views = self._views
+        if views.get(ref.row) is ref:
+            del views[ref.row]
+            if not views:
+                # Deleting keys never shrinks a dict, start over with a small one.
+                self._views = {}
+
+
 class Node:
+    __slots__ = ("_store", "_row", "__weakref__")
+
     def __init__(
         self,
         node_id,
@@ -8,30 +671,72 @@ class Node:
         baglanti_sayisi=0,
         komsular=None
     ):
-        self.id = node_id
-        self.name = name
+        # A node created on its own gets a private one-row store; Graph
+        # moves it into the graph's store when the node is added.
+        self._store = NodeStore()
+        self._store.private = True
+        self._row = self._store.append(
+            node_id, name, aktiflik, etkilesim, baglanti_sayisi, komsular
+        )
+        self._store._track(self._row, self)
 
-        self.aktiflik = aktiflik
-        self.etkilesim = etkilesim
-        self.baglanti_sayisi = baglanti_sayisi
+    @property
+    def id(self):
+        return self._store.ids[self._row]
+
+    @property
+    def name(self):
+        return self._store.names[self._row]
+
+    @name.setter
+    def name(self, value):
+        self._store.names[self._row] = value
+
+    @property
+    def aktiflik(self):
+        return self._store.aktiflik[self._row]
+
+    @aktiflik.setter
+    def aktiflik(self, value):
+        self._store.aktiflik[self._row] = float(value)
+
+    @property
+    def etkilesim(self):
+        return self._store.etkilesim[self._row]
+
+    @etkilesim.setter
+    def etkilesim(self, value):
+        self._store.etkilesim[self._row] = int(value)
+
+    @property
+    def baglanti_sayisi(self):
+        return self._store.baglanti_sayisi[self._row]
+
+    @baglanti_sayisi.setter
+    def baglanti_sayisi(self, value):
+        self._store.baglanti_sayisi[self._row] = int(value)
+
+    @property
+    def komsular(self):
+        # A copy: change the neighbours through komsu_ekle/komsu_sil or by assignment.
+        return self._store.komsular[self._row]
+
+    @komsular.setter
+    def komsular(self, value):
+        self._store.komsular.set(self._row, value)
 
-        if komsular is None:
-            self.komsular = []
-        else:
-            self.komsular = list(komsular)
 
-    
     def komsu_ekle(self, node_id):
-        if node_id not in self.komsular:
-            self.komsular.append(node_id)
-            self.baglanti_sayisi = len(self.komsular)
+        komsular = self._store.komsular
+        if komsular.add(self._row, node_id):
+            self.baglanti_sayisi = komsular.degree(self._row)
 
     def komsu_sil(self, node_id):
-        if node_id in self.komsular:
-            self.komsular.remove(node_id)
-            self.baglanti_sayisi = len(self.komsular)
+        komsular = self._store.komsular
+        if komsular.discard(self._row, node_id):
+            self.baglanti_sayisi = komsular.degree(self._row)
+
 
-    
     def to_dict(self):
         return {
             "id": self.id,
@@ -39,7 +744,7 @@ class Node:
             "aktiflik": self.aktiflik,
             "etkilesim": self.etkilesim,
             "baglanti_sayisi": self.baglanti_sayisi,
-            "komsular": self.komsular
+            "komsular": list(self.komsular)
         }
 
     @staticmethod
@@ -53,7 +758,7 @@ class Node:
             komsular=data.get("komsular", [])
         )
 
-    
+
     def __repr__(self):
         return (
             f"Node(id={self.id}, name='{self.name}', "
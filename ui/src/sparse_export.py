@@ -0,0 +1,119 @@
+import csv
+
+from .compat import np  # only needed for the .npz export
+
+COO = "coo"
+MATRIX_MARKET = "mtx"
+CSR_NPZ = "npz"
+DENSE = "dense"
+
+FORMATS = (COO, MATRIX_MARKET, CSR_NPZ, DENSE)
+
+
+def format_for_path(path):
+    """Export format implied by a file name; plain .csv means the COO edge list."""
+    lower = str(path).lower()
+    if lower.endswith(".mtx"):
+        return MATRIX_MARKET
+    if lower.endswith(".npz"):
+        return CSR_NPZ
+    return COO
+
+
+def _sorted_index(graph):
+    # Matrix rows/columns follow ascending node id, like the dense CSV.
+    ids = sorted(graph._store.ids)
+    return ids, {nid: i for i, nid in enumerate(ids)}
+
+
+def write_coo(graph, path):
+    """``from,to,weight`` edge list, one line per undirected edge (re-importable via load_from_csv)."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["from", "to", "weight"])
+        writer.writerows((e.source, e.target, e.weight) for e in graph._edge_index.values())
+
+
+def write_matrix_market(graph, path):
+    """
+    Symmetric real coordinate Matrix Market file (lower triangle, 1-based).
+    The ``% ids`` comment lists the node id of every row/column in order.
+    """
+    ids, index_of = _sorted_index(graph)
+    edges = graph._edge_index.values()
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("%%MatrixMarket matrix coordinate real symmetric\n")
+        f.write("% ids " + " ".join(map(str, ids)) + "\n")
+        f.write(f"{len(ids)} {len(ids)} {len(edges)}\n")
+        for e in edges:
+            i, j = index_of[e.source] + 1, index_of[e.target] + 1
+            if i < j:
+                i, j = j, i
+            f.write(f"{i} {j} {e.weight!r}\n")
+
+
+def write_csr_npz(graph, path):
+    """
+    Symmetric CSR matrix in the layout of ``scipy.sparse.save_npz``
+    (data/indices/indptr/format/shape), plus an ``ids`` array that maps
+    row numbers back to node ids.
+    """
+    if np is None:
+        raise RuntimeError("CSR .npz çıktısı için numpy gerekli")
+
+    ids, index_of = _sorted_index(graph)
+    edges = list(graph._edge_index.values())
+    n, m = len(ids), len(edges)
+
+    src = np.fromiter((index_of[e.source] for e in edges), dtype=np.int64, count=m)
+    dst = np.fromiter((index_of[e.target] for e in edges), dtype=np.int64, count=m)
+    weight = np.fromiter((e.weight for e in edges), dtype=np.float64, count=m)
+
+    rows = np.concatenate((src, dst))
+    cols = np.concatenate((dst, src))
+    data = np.concatenate((weight, weight))
+    order = np.lexsort((cols, rows))
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+    np.savez_compressed(
+        path,
+        data=data[order],
+        indices=cols[order],
+        indptr=indptr,
+        format=b"csr",
+        shape=np.array((n, n)),
+        ids=np.array(ids),
+    )
+
+
+def write_dense_csv(graph, path):
+    """0/1 V×V matrix with id headers, written one row at a time."""
+    ids, index_of = _sorted_index(graph)
+    n = len(ids)
+
+    neighbors = [[] for _ in range(n)]
+    for e in graph._edge_index.values():
+        i, j = index_of[e.source], index_of[e.target]
+        neighbors[i].append(j)
+        neighbors[j].append(i)
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([""] + [str(nid) for nid in ids])
+        for i, nid in enumerate(ids):
+            row = ["0"] * n
+            for j in neighbors[i]:
+                row[j] = "1"
+            writer.writerow([str(nid)] + row)
+            neighbors[i] = None
+
+
+WRITERS = {
+    COO: write_coo,
+    MATRIX_MARKET: write_matrix_market,
+    CSR_NPZ: write_csr_npz,
+    DENSE: write_dense_csv,
+}
@@ -0,0 +1,407 @@
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from .graph import Graph, _mutation
+from .node import Node, NodeStore
+from .edge import Edge
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    aktiflik REAL NOT NULL DEFAULT 0,
+    etkilesim INTEGER NOT NULL DEFAULT 0,
+    baglanti_sayisi INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS edges (
+    source INTEGER NOT NULL,
+    target INTEGER NOT NULL,
+    weight REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS edges_source ON edges (source);
+CREATE INDEX IF NOT EXISTS edges_target ON edges (target);
+CREATE UNIQUE INDEX IF NOT EXISTS edges_pair ON edges (min(source, target), max(source, target));
+"""
+
+_PAIR = "min(source, target) = ? AND max(source, target) = ?"
+
+
+class SQLiteGraph(Graph):
+    """
+    Graph whose nodes and edges live in a SQLite database.
+
+    Point operations (get_node_by_id, neighbours, get_edge, add/remove of
+    nodes and edges) are indexed queries and every mutation is committed
+    as it happens, so opening a database is instant and nothing has to be
+    rewritten on save. Whole-graph algorithms (and nodes/edges) read the
+    full graph once into the usual in-memory columns; that copy is dropped
+    on the next mutation. Neighbours are ordered by edge insertion.
+
+    Nodes returned here are detached copies: change them through
+    update_node(), not by assigning attributes.
+    """
+
+    def __init__(self, db_path):
+        self._conn = None
+        super().__init__(data_path=db_path)
+
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        self._mem_store = None
+        self._mem_edges = None
+        self._replaced = False
+
+    # In-memory copy used by whole-graph code paths. Assigning it (as the
+    # JSON/CSV loaders do) replaces the database content on the next
+    # _mark_dirty().
+
+    @property
+    def _store(self):
+        if self._mem_store is None:
+            self._materialize()
+        return self._mem_store
+
+    @_store.setter
+    def _store(self, store):
+        self._mem_store = store
+        self._replaced = True
+
+    @property
+    def _edge_index(self):
+        if self._mem_edges is None:
+            self._materialize()
+        return self._mem_edges
+
+    @_edge_index.setter
+    def _edge_index(self, edge_index):
+        self._mem_edges = edge_index
+        self._replaced = True
+
+    def _materialize(self):
+        with self._lock:
+            edges = {}
+            for u, v, w in self._conn.execute(
+                    "SELECT source, target, weight FROM edges ORDER BY rowid"):
+                edges[self._edge_key(u, v)] = Edge(u, v, w)
+
+            if self._mem_store is None:
+                store = NodeStore()
+                with store.bulk():
+                    for row in self._conn.execute(
+                            "SELECT id, name, aktiflik, etkilesim, baglanti_sayisi FROM nodes ORDER BY id"):
+                        store.append(*row)
+                    for e in edges.values():
+                        store.komsular.add(store.row_of[e.source], e.target)
+                        store.komsular.add(store.row_of[e.target], e.source)
+                self._mem_store = store
+
+            if self._mem_edges is None:
+                self._mem_edges = edges
+
+    def _write_all(self):
+        store, edges = self._mem_store, self._mem_edges
+        with self._transaction():
+            self._conn.execute("DELETE FROM edges")
+            self._conn.execute("DELETE FROM nodes")
+            self._conn.executemany(
+                "INSERT INTO nodes (id, name, aktiflik, etkilesim, baglanti_sayisi) VALUES (?, ?, ?, ?, ?)",
+                zip(store.ids, store.names, store.aktiflik, store.etkilesim, store.baglanti_sayisi)
+            )
+            self._conn.executemany(
+                "INSERT INTO edges (source, target, weight) VALUES (?, ?, ?)",
+                ((e.source, e.target, e.weight) for e in edges.values())
+            )
+
+    def _mark_dirty(self):
+        if self._conn is None:
+            return
+        if self._replaced:
+            if self._mem_store is None or self._mem_edges is None:
+                self._materialize()
+            self._write_all()
+            self._replaced = False
+        self._mem_store = None
+        self._mem_edges = None
+        super()._mark_dirty()
+
+    @contextmanager
+    def _transaction(self):
+        # Savepoints nest, so this works on its own and inside batch().
+        with self._lock:
+            self._conn.execute("SAVEPOINT mutation")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK TO mutation")
+                self._conn.execute("RELEASE mutation")
+                raise
+            self._conn.execute("RELEASE mutation")
+
+    @contextmanager
+    def batch(self):
+        """Runs the block in one SQLite transaction; an exception rolls it back."""
+        with self._lock:
+            outermost = not self._batch_depth
+            if outermost:
+                self._batch_dirty = False
+            self._batch_depth += 1
+            try:
+                with self._transaction():
+                    yield self
+            except BaseException:
+                self._batch_depth -= 1
+                self._replaced = False
+                # The cached copy may hold rolled-back changes.
+                self._mem_store = None
+                self._mem_edges = None
+                self._csr = None
+                if outermost:
+                    self._batch_dirty = False
+                    self._mark_dirty()
+                raise
+            self._batch_depth -= 1
+
+            if outermost and self._batch_dirty:
+                self._batch_dirty = False
+                self._mark_dirty()
+
+    # Persistence: the database is always current.
+
+    def load(self, path):
+        if self._conn is None or os.path.abspath(path) == os.path.abspath(self.data_path):
+            return
+        super().load(path)
+
+    def save(self, path):
+        if os.path.abspath(path) == os.path.abspath(self.data_path):
+            return
+        super().save(path)
+
+    def _autosave(self):
+        pass
+
+    def close(self):
+        super().close()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # Indexed point queries
+
+    def neighbors(self, node_id):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT CASE WHEN source = ? THEN target ELSE source END FROM edges "
+                "WHERE source = ? OR target = ? ORDER BY rowid",
+                (node_id, node_id, node_id)
+            )
+            return [nb for nb, in rows]
+
+    def get_node_by_id(self, node_id):
+        if self._mem_store is not None:
+            return self._mem_store.get(node_id)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, name, aktiflik, etkilesim, baglanti_sayisi FROM nodes WHERE id = ?",
+                (node_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            return Node(*row, komsular=self.neighbors(node_id))
+
+    def get_edge(self, source_id, target_id):
+        if self._mem_edges is not None:
+            return self._mem_edges.get(self._edge_key(source_id, target_id))
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT source, target, weight FROM edges WHERE {_PAIR}",
+                self._edge_key(source_id, target_id)
+            ).fetchone()
+        return Edge(*row) if row is not None else None
+
+    def edge_exists(self, source_id, target_id):
+        return self.get_edge(source_id, target_id) is not None
+
+    def _update_degrees(self, conn, *node_ids):
+        conn.executemany(
+            "UPDATE nodes SET baglanti_sayisi = "
+            "(SELECT COUNT(*) FROM edges WHERE source = ?1 OR target = ?1) WHERE id = ?1",
+            ((nid,) for nid in node_ids)
+        )
+
+    # Mutators
+
+    @_mutation
+    def add_node(self, node: Node):
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT INTO nodes (id, name, aktiflik, etkilesim, baglanti_sayisi) VALUES (?, ?, ?, ?, ?)",
+                    (node.id, node.name, node.aktiflik, node.etkilesim, node.baglanti_sayisi)
+                )
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Aynı ID'ye sahip node zaten var: {node.id}") from None
+        self._mark_dirty()
+
+    @_mutation
+    def update_node(self, node_id, name=None, aktiflik=None, etkilesim=None):
+        node = self.get_node_by_id(node_id)
+        if node is None:
+            raise ValueError("Node bulunamadı")
+
+        if name is not None:
+            node.name = name
+        if aktiflik is not None:
+            node.aktiflik = float(aktiflik)
+        if etkilesim is not None:
+            node.etkilesim = int(etkilesim)
+        node.baglanti_sayisi = len(node.komsular)
+
+        changed = set()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE nodes SET name = ?, aktiflik = ?, etkilesim = ?, baglanti_sayisi = ? WHERE id = ?",
+                (node.name, node.aktiflik, node.etkilesim, node.baglanti_sayisi, node_id)
+            )
+            for nb_id in node.komsular:
+                e = self.get_edge(node_id, nb_id)
+                nb_node = self.get_node_by_id(nb_id)
+                if e is None or nb_node is None:
+                    continue
+                n1, n2 = (node, nb_node) if e.source == node_id else (nb_node, node)
+                w = self.calculate_weight(n1, n2)
+                if w != e.weight:
+                    e.weight = w
+                    changed.add(e)
+                    conn.execute(
+                        f"UPDATE edges SET weight = ? WHERE {_PAIR}",
+                        (w, *self._edge_key(e.source, e.target))
+                    )
+
+        self._mark_dirty()
+        return changed
+
+    @_mutation
+    def remove_node(self, node_id):
+        with self._transaction() as conn:
+            deleted = conn.execute("DELETE FROM nodes WHERE id = ?", (node_id,)).rowcount
+            if not deleted:
+                raise ValueError("Node bulunamadı")
+            conn.execute("DELETE FROM edges WHERE source = ? OR target = ?", (node_id, node_id))
+        self._mark_dirty()
+
+    @_mutation
+    def recompute_weights(self):
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT e.rowid, a.aktiflik, a.etkilesim, a.baglanti_sayisi, "
+                "b.aktiflik, b.etkilesim, b.baglanti_sayisi "
+                "FROM edges e JOIN nodes a ON a.id = e.source JOIN nodes b ON b.id = e.target"
+            ).fetchall()
+            conn.executemany("UPDATE edges SET weight = ? WHERE rowid = ?", (
+                (1 / (1 + (a1 - b1) ** 2 + (a2 - b2) ** 2 + (a3 - b3) ** 2), rowid)
+                for rowid, a1, a2, a3, b1, b2, b3 in rows
+            ))
+        self._mark_dirty()
+
+    @_mutation
+    def add_edge(self, source_id, target_id):
+        if source_id == target_id:
+            raise ValueError("Self-loop yasak")
+
+        node1 = self.get_node_by_id(source_id)
+        node2 = self.get_node_by_id(target_id)
+        if node1 is None or node2 is None:
+            raise ValueError("Node bulunamadı")
+
+        if self.edge_exists(source_id, target_id):
+            raise ValueError("Bu edge zaten var")
+
+        weight = self.calculate_weight(node1, node2)
+
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO edges (source, target, weight) VALUES (?, ?, ?)",
+                (source_id, target_id, weight)
+            )
+            self._update_degrees(conn, source_id, target_id)
+        self._mark_dirty()
+
+    @_mutation
+    def remove_edge(self, source_id, target_id):
+        with self._transaction() as conn:
+            deleted = conn.execute(
+                f"DELETE FROM edges WHERE {_PAIR}", self._edge_key(source_id, target_id)
+            ).rowcount
+            if not deleted:
+                raise ValueError("Edge bulunamadı")
+            self._update_degrees(conn, source_id, target_id)
+        self._mark_dirty()
+
+    @_mutation
+    def apply_delta(self, delta):
+        """Graph.apply_delta with indexed statements instead of a full rewrite."""
+        if isinstance(delta, (str, os.PathLike)):
+            with open(delta, "r", encoding="utf-8") as f:
+                delta = json.load(f)
+
+        # neighbours of removed nodes, whose degree is not kept by remove_node
+        touched = set()
+        updated = set()
+        added = set()
+        with self.batch():
+            for u, v in map(self._delta_pair, delta.get("remove_edges", ())):
+                self.remove_edge(u, v)
+            for node_id in delta.get("remove_nodes", ()):
+                touched.update(self.neighbors(node_id))
+                self.remove_node(node_id)
+                touched.discard(node_id)
+            for n in delta.get("add_nodes", ()):
+                self.add_node(Node(
+                    n["id"],
+                    n.get("name", f"Node {n['id']}"),
+                    n.get("aktiflik", 0.0),
+                    n.get("etkilesim", 0),
+                    n.get("baglanti_sayisi", 0)
+                ))
+            with self._transaction() as conn:
+                for n in delta.get("update_nodes", ()):
+                    aktiflik, etkilesim = n.get("aktiflik"), n.get("etkilesim")
+                    found = conn.execute(
+                        "UPDATE nodes SET name = coalesce(?, name), aktiflik = coalesce(?, aktiflik), "
+                        "etkilesim = coalesce(?, etkilesim) WHERE id = ?",
+                        (n.get("name"),
+                         None if aktiflik is None else float(aktiflik),
+                         None if etkilesim is None else int(etkilesim),
+                         n["id"])
+                    ).rowcount
+                    if not found:
+                        raise ValueError("Node bulunamadı")
+                    updated.add(n["id"])
+            for u, v in map(self._delta_pair, delta.get("add_edges", ())):
+                self.add_edge(u, v)
+                added.add(self._edge_key(u, v))
+
+            # As in Graph: degrees first, then only the new edges and the
+            # edges of updated nodes are reweighted.
+            pairs = dict.fromkeys(added)
+            for node_id in updated:
+                pairs.update(dict.fromkeys(self._edge_key(node_id, nb) for nb in self.neighbors(node_id)))
+
+            changed = {}
+            with self._transaction() as conn:
+                self._update_degrees(conn, *touched)
+                for pair in pairs:
+                    e = self.get_edge(*pair)
+                    w = self.calculate_weight(self.get_node_by_id(e.source), self.get_node_by_id(e.target))
+                    if w != e.weight or pair in added:
+                        e.weight = w
+                        changed[pair] = e
+                        conn.execute(f"UPDATE edges SET weight = ? WHERE {_PAIR}", (w, *pair))
+            self._mark_dirty()
+        return set(changed.values())
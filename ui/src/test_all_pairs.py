@@ -0,0 +1,35 @@
+import pytest
+
+from ui.src.algorithms.all_pairs import DIJKSTRA, FLOYD_WARSHALL
+from ui.src.compat import np
+
+
+METHODS = [DIJKSTRA, pytest.param(FLOYD_WARSHALL, marks=pytest.mark.skipif(np is None, reason="numpy yok"))]
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_matrix_matches_reference(random_graph, reference_costs, method):
+    sources = [0, 17, 42]
+    matrix = random_graph.all_pairs(sources=sources, method=method, workers=1)
+    for start in sources:
+        expected = reference_costs(random_graph, start)
+        distances = matrix.distances(start)
+        assert distances.keys() == expected.keys()
+        for node_id, cost in expected.items():
+            # float32 matrix
+            assert distances[node_id] == pytest.approx(cost, rel=1e-5)
+
+
+def test_full_matrix_is_cached_per_version(random_graph):
+    full = random_graph.all_pairs(method=DIJKSTRA, workers=1)
+    assert random_graph.all_pairs(sources=[3, 4]) is full
+
+    edge = random_graph.edges[0]
+    random_graph.remove_edge(edge.source, edge.target)
+    assert random_graph.all_pairs(sources=[3, 4]) is not full
+
+
+def test_closeness(random_graph, reference_costs):
+    matrix = random_graph.all_pairs(sources=[0], method=DIJKSTRA, workers=1)
+    total = sum(reference_costs(random_graph, 0).values())
+    assert matrix.closeness(0) == pytest.approx((len(random_graph.nodes) - 1) / total, rel=1e-5)
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from ui.src.algorithms.a_star import zero_heuristic
+from ui.src.graph import Graph
+
+
+def test_astar_finds_shortest_paths(random_graph, check_paths):
+    check_paths(random_graph.astar)
+
+
+def test_custom_heuristic(random_graph, check_paths):
+    check_paths(lambda start, end: random_graph.astar(start, end, heuristic=zero_heuristic))
+
+
+def test_heuristic_holds_for_imported_weights(random_graph, query_pairs, tmp_path):
+    # Weights that no longer follow the formula shrink the attribute bound.
+    path = tmp_path / "imported.json"
+    random_graph.save_to_json(str(path))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    for i, edge in enumerate(data["edges"]):
+        edge["weight"] *= 100 if i % 2 else 0.5
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    g = Graph(str(tmp_path / "other.json"))
+    g.load_from_json(str(path))
+    for start, end in query_pairs:
+        try:
+            expected = g.dijkstra(start, end)[1]
+        except ValueError:
+            continue
+        assert g.astar(start, end)[1] == pytest.approx(expected)
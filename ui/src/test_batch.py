@@ -0,0 +1,67 @@
+import pytest
+
+from ui.src.graph import Graph
+from ui.src.node import Node
+
+
+@pytest.fixture
+def graph(tmp_path):
+    g = Graph(str(tmp_path / "graph.json"))
+    for i in range(1, 7):
+        g.add_node(Node(i, f"Node {i}", 0.1 * i, 10 * i))
+    for u, v in [(1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (1, 6)]:
+        g.add_edge(u, v)
+    return g
+
+
+def test_rollback_restores_nodes_and_edges(graph, state):
+    before = state(graph)
+    with pytest.raises(RuntimeError):
+        with graph.batch():
+            graph.add_node(Node(100, "X", 0.5, 10))
+            graph.add_edge(100, 1)
+            graph.update_node(1, aktiflik=0.9, name="changed")
+            graph.remove_edge(3, 4)
+            graph.remove_node(2)
+            graph.recompute_weights()
+            raise RuntimeError
+
+    assert state(graph) == before
+    assert graph.get_node_by_id(100) is None
+    assert graph.edge_exists(1, 2) and graph.edge_exists(3, 4)
+
+
+def test_rollback_keeps_views_across_swap_remove(graph):
+    # Removing row 0 moves the last node into it; both views must read
+    # their own node again after the rollback.
+    first = graph.get_node_by_id(1)
+    last = graph.get_node_by_id(6)
+    with pytest.raises(RuntimeError):
+        with graph.batch():
+            graph.remove_node(1)
+            assert graph.get_node_by_id(6).name == "Node 6"
+            raise RuntimeError
+
+    assert graph.get_node_by_id(1) is first
+    assert graph.get_node_by_id(6) is last
+    assert (first.name, sorted(first.komsular)) == ("Node 1", [2, 6])
+    assert (last.name, sorted(last.komsular)) == ("Node 6", [1, 5])
+
+
+def test_nested_batch_rolls_back_to_its_own_mark(graph):
+    with graph.batch():
+        graph.add_edge(1, 3)
+        with pytest.raises(RuntimeError):
+            with graph.batch():
+                graph.add_edge(1, 4)
+                raise RuntimeError
+    assert graph.edge_exists(1, 3)
+    assert not graph.edge_exists(1, 4)
+
+
+def test_batch_bumps_version_once(graph):
+    version = graph.version
+    with graph.batch():
+        graph.add_edge(1, 3)
+        graph.remove_edge(1, 2)
+    assert graph.version == version + 1
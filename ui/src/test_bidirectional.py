@@ -0,0 +1,6 @@
+def test_bidirectional_finds_shortest_paths(random_graph, check_paths):
+    check_paths(random_graph.bidirectional_dijkstra)
+
+
+def test_same_start_and_end(random_graph):
+    assert random_graph.bidirectional_dijkstra(3, 3) == ([3], 0.0)
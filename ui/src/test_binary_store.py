@@ -0,0 +1,65 @@
+import pytest
+
+from ui.src import binary_store
+from ui.src.graph import Graph
+from ui.src.node import Node
+
+
+@pytest.fixture
+def snapshot_path(sample_graph, tmp_path):
+    # A renamed node and a removed edge make the columns differ from the JSON order.
+    sample_graph.update_node(1, name="Düğüm 1 ş")
+    sample_graph.remove_edge(1, 2)
+    sample_graph.add_node(Node(100, "", 0.5, 7))
+    path = tmp_path / "graph.ygraph"
+    sample_graph.save(str(path))
+    return str(path)
+
+
+def test_round_trip(sample_graph, snapshot_path, state, tmp_path):
+    g = Graph(str(tmp_path / "other.json"))
+    g.load(snapshot_path)
+    assert state(g) == state(sample_graph)
+    assert [n.baglanti_sayisi for n in g.nodes] == [n.baglanti_sayisi for n in sample_graph.nodes]
+    assert g.get_node_by_id(1).name == "Düğüm 1 ş"
+    assert g.get_node_by_id(100).name == ""
+
+    # The loaded graph stays editable.
+    g.add_edge(1, 2)
+    assert g.edge_exists(1, 2)
+
+
+def test_snapshot_csr_answers_queries(sample_graph, snapshot_path):
+    expected = sample_graph.compile()
+    with binary_store.BinarySnapshot(snapshot_path) as snap:
+        assert snap.node_count == len(sample_graph.nodes)
+        assert snap.edge_count == len(sample_graph.edges)
+        assert snap.name(0) == "Düğüm 1 ş"
+
+        csr = snap.csr()
+        start = sample_graph.nodes[0].id
+        assert csr.bfs(start) == expected.bfs(start)
+        assert csr.dfs(start) == expected.dfs(start)
+        assert csr.connected_components(0.3) == expected.connected_components(0.3)
+        for node in sample_graph.nodes[1:]:
+            try:
+                path = expected.dijkstra(start, node.id)
+            except ValueError:
+                continue
+            assert csr.dijkstra(start, node.id) == path
+            assert csr.astar(start, node.id)[1] == pytest.approx(path[1])
+        del csr
+
+
+def test_copied_csr_outlives_the_file(snapshot_path, sample_graph):
+    with binary_store.BinarySnapshot(snapshot_path) as snap:
+        csr = snap.csr(copy=True)
+    start = sample_graph.nodes[0].id
+    assert csr.bfs(start) == sample_graph.compile().bfs(start)
+
+
+def test_invalid_file_is_rejected(tmp_path):
+    path = tmp_path / "bad.ygraph"
+    path.write_bytes(b"not a graph")
+    with pytest.raises(ValueError):
+        binary_store.BinarySnapshot(str(path))
@@ -0,0 +1,40 @@
+import pytest
+
+from ui.src.graph import Graph
+from ui.src.node import Node
+
+
+@pytest.fixture
+def graph(tmp_path):
+    # 3 lists 4 in komsular without an Edge between them.
+    g = Graph(str(tmp_path / "graph.json"))
+    g.add_node(Node(1, "A", 0.1, 10))
+    g.add_node(Node(2, "B", 0.2, 12))
+    g.add_node(Node(3, "C", 0.3, 14, komsular=[4]))
+    g.add_node(Node(4, "D", 0.4, 16))
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    return g
+
+
+def slot(csr, u, v):
+    i, j = csr.index_of[u], csr.index_of[v]
+    return next(k for k in csr.neighbor_range(i) if csr.neighbors[k] == j)
+
+
+def test_slot_without_edge_has_zero_weight(graph):
+    csr = graph.compile()
+    k = slot(csr, 3, 4)
+    assert csr.weights[k] == 0.0
+    # Dijkstra still charges the formula weight on it.
+    weight = graph.calculate_weight(graph.get_node_by_id(3), graph.get_node_by_id(4))
+    assert csr.costs[k] == pytest.approx(1 / weight)
+    assert csr.weights[slot(csr, 1, 2)] == graph.get_edge(1, 2).weight
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.001, 0.5])
+def test_thresholds_match_graph(graph, threshold):
+    csr = graph.compile()
+    assert sorted(map(sorted, csr.connected_components(threshold))) == \
+        sorted(map(sorted, graph.connected_components(threshold)))
+    assert csr.welsh_powell(threshold) == graph.welsh_powell(threshold)
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from ui.src.graph import Graph
+
+
+def write_shards(tmp_path, lines, count, header=None):
+    size = -(-len(lines) // count)
+    for k in range(count):
+        part = lines[k * size:(k + 1) * size]
+        if header is not None:
+            part = [header] + part
+        (tmp_path / f"part{k}.csv").write_text("\n".join(part) + "\n", encoding="utf-8")
+    return str(tmp_path / "part*.csv")
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_edge_list_shards_match_single_file(tmp_path, state, data_dir, workers):
+    path = os.path.join(data_dir, "sample_40.csv")
+    whole = Graph(str(tmp_path / "whole.json"))
+    whole.load_from_csv(path)
+
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().split()
+    # The second shard repeats an edge of the first one, reversed.
+    u, v = lines[0].split(",")[:2]
+    lines.insert(len(lines) // 2 + 1, f"{v},{u}")
+    pattern = write_shards(tmp_path, lines, 3)
+
+    done = []
+    g = Graph(str(tmp_path / "graph.json"))
+    g.import_csv_shards(pattern, workers=workers, progress=lambda k, total: done.append((k, total)))
+    assert state(g) == state(whole)
+    assert done == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_node_row_shards_are_merged(tmp_path, state):
+    header = "DugumId,Aktiflik,Etkilesim,Baglanti,Komsular"
+    rows = ["1,0.5,10,2,2,3", "2,0.4,12,1,1", "3,0.3,14,2,1,4", "4,0.2,16,1,3", "3,0.9,99,0"]
+    whole = tmp_path / "whole.csv"
+    whole.write_text("\n".join([header] + rows) + "\n", encoding="utf-8")
+    expected = Graph(str(tmp_path / "whole.json"))
+    expected.load_from_csv(str(whole))
+
+    g = Graph(str(tmp_path / "graph.json"))
+    g.import_csv_shards(write_shards(tmp_path, rows, 2, header), workers=2)
+    assert state(g) == state(expected)
+    assert g.get_node_by_id(3).etkilesim == 14  # the first row of a node wins
+
+
+def test_mixed_layouts_are_rejected(tmp_path):
+    (tmp_path / "a.csv").write_text("from,to\n1,2\n", encoding="utf-8")
+    (tmp_path / "b.csv").write_text("DugumId,Aktiflik,Etkilesim,Baglanti,Komsular\n1,0.5,1,0\n",
+                                    encoding="utf-8")
+    g = Graph(str(tmp_path / "graph.json"))
+    with pytest.raises(ValueError):
+        g.import_csv_shards([tmp_path / "a.csv", tmp_path / "b.csv"])
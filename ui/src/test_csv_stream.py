@@ -0,0 +1,68 @@
+import os
+
+import pytest
+
+from ui.src import csv_stream
+from ui.src.graph import Graph
+
+NODE_HEADER = "DugumId,Aktiflik,Etkilesim,Baglanti,Komsular"
+
+
+def write(tmp_path, name, lines):
+    path = tmp_path / name
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_sample_40_is_an_edge_list(data_dir):
+    assert csv_stream.detect_format(os.path.join(data_dir, "sample_40.csv")) == csv_stream.EDGE_LIST
+
+
+@pytest.mark.parametrize("lines, expected", [
+    ([NODE_HEADER, "1,0.5,10,2,2,3"], csv_stream.NODE_ROWS),
+    (["﻿" + NODE_HEADER, "1,0.5,10,1,2"], csv_stream.NODE_ROWS),
+    (["1,0.5,10,2,2,3", "2,0.4,12,1,1"], csv_stream.NODE_ROWS),
+    (["Kaynak;Hedef;Agirlik", "1;2;0.5"], csv_stream.EDGE_LIST),
+    (["from,to", "1,2"], csv_stream.EDGE_LIST),
+    (["1,2", "2,3,0.25"], csv_stream.EDGE_LIST),
+])
+def test_detect_format(tmp_path, lines, expected):
+    assert csv_stream.detect_format(write(tmp_path, "g.csv", lines)) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 10000])
+def test_sample_40_loads_the_same_in_any_chunk_size(data_dir, tmp_path, state, chunk_size):
+    path = os.path.join(data_dir, "sample_40.csv")
+    reference = Graph(str(tmp_path / "reference.json"))
+    reference.load_from_csv(path)
+    g = Graph(str(tmp_path / "graph.json"))
+    g.load_from_csv(path, chunk_size=chunk_size)
+
+    assert state(g) == state(reference)
+    assert len(g.nodes) == 40
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            u, v, w = line.strip().split(",")
+            assert g.get_edge(int(u), int(v)).weight == float(w)
+    for n in g.nodes:
+        assert n.baglanti_sayisi == len(n.komsular)
+
+
+def test_unweighted_edges_get_the_formula_weight(tmp_path):
+    g = Graph(str(tmp_path / "graph.json"))
+    g.load_from_csv(write(tmp_path, "g.csv", ["from,to", "1,2", "2,3", "3,1", "1,2", "4,4"]))
+    assert len(g.edges) == 3  # duplicates and self loops are dropped
+    for e in g.edges:
+        nodes = map(g.get_node_by_id, (e.source, e.target))
+        assert e.weight == g.calculate_weight(*nodes)
+
+
+def test_node_rows_link_both_ways(tmp_path):
+    g = Graph(str(tmp_path / "graph.json"))
+    # 3 lists 2, but 2 does not list 3.
+    g.load_from_csv(write(tmp_path, "g.csv", [NODE_HEADER, "1,0.5,10,2,2,3", "2,0.4,12,1,1", "3,0.3,14,2,1,2"]))
+    assert sorted(g.get_node_by_id(2).komsular) == [1, 3]
+    assert g.edge_exists(2, 3)
+    assert len(g.edges) == 3
+    # The table's own connection count is kept.
+    assert g.get_node_by_id(2).baglanti_sayisi == 1
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+
+def weights(g):
+    return {(e.source, e.target): e.weight for e in g.edges}
+
+
+def test_added_edge_leaves_imported_weights_alone(sample_graph):
+    before = weights(sample_graph)
+    changed = sample_graph.apply_delta({"add_edges": [[1, 3]]})
+
+    after = weights(sample_graph)
+    added = sample_graph.get_edge(1, 3)
+    assert changed == {added}
+    assert added.weight == sample_graph.calculate_weight(
+        sample_graph.get_node_by_id(1), sample_graph.get_node_by_id(3))
+    del after[added.source, added.target]
+    assert after == before
+    assert sample_graph.get_node_by_id(1).baglanti_sayisi == len(sample_graph.get_node_by_id(1).komsular)
+
+
+def test_update_reweights_only_incident_edges(sample_graph):
+    before = weights(sample_graph)
+    changed = sample_graph.apply_delta({"update_nodes": [{"id": 1, "aktiflik": 0.1}]})
+
+    node = sample_graph.get_node_by_id(1)
+    incident = {sample_graph.get_edge(1, nb) for nb in node.komsular}
+    assert changed == incident
+    for e in incident:
+        nodes = map(sample_graph.get_node_by_id, (e.source, e.target))
+        assert e.weight == sample_graph.calculate_weight(*nodes)
+    for pair, weight in weights(sample_graph).items():
+        if 1 not in pair:
+            assert weight == before[pair]
+
+
+def test_removals_update_degrees(sample_graph):
+    neighbours = sample_graph.get_node_by_id(1).komsular
+    sample_graph.apply_delta({"remove_nodes": [1], "remove_edges": [{"from": 2, "to": 3}]})
+    assert sample_graph.get_node_by_id(1) is None
+    assert not sample_graph.edge_exists(2, 3)
+    for nb_id in neighbours + [2, 3]:
+        node = sample_graph.get_node_by_id(nb_id)
+        assert 1 not in node.komsular
+        assert node.baglanti_sayisi == len(node.komsular)
+
+
+def test_invalid_entry_rolls_back(sample_graph, state, tmp_path):
+    before = state(sample_graph)
+    path = tmp_path / "delta.json"
+    path.write_text(json.dumps({
+        "add_nodes": [{"id": 100}],
+        "add_edges": [[100, 1], [100, 999]],
+    }), encoding="utf-8")
+    with pytest.raises(ValueError):
+        sample_graph.apply_delta(str(path))
+    assert state(sample_graph) == before
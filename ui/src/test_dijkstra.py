@@ -0,0 +1,32 @@
+import pytest
+
+from ui.src.algorithms.dijkstra import Dijkstra
+
+
+def test_graph_dijkstra_finds_shortest_paths(random_graph, check_paths):
+    check_paths(random_graph.dijkstra)
+
+
+def test_engine_runs_on_graph_and_csr(random_graph, query_pairs):
+    csr = random_graph.compile()
+    for start, end in query_pairs:
+        try:
+            expected = Dijkstra.run(random_graph, start, end)
+        except ValueError:
+            with pytest.raises(ValueError):
+                Dijkstra.run(csr, start, end)
+            continue
+        assert Dijkstra.run(csr, start, end) == expected
+
+
+def test_all_distances(random_graph, reference_costs):
+    expected = reference_costs(random_graph, 0)
+    distances = Dijkstra.all_distances(random_graph, 0)
+    assert distances.keys() == expected.keys()
+    for node_id, cost in expected.items():
+        assert distances[node_id] == pytest.approx(cost)
+
+
+def test_unknown_node_raises(random_graph):
+    with pytest.raises(ValueError):
+        random_graph.dijkstra(0, 12345)
@@ -0,0 +1,81 @@
+from ui.src.graph import Graph
+from ui.src.node import Node
+
+
+def small_graph(path):
+    g = Graph(str(path), journal=True)
+    for i in range(1, 6):
+        g.add_node(Node(i, f"Node {i}", 0.1 * i, 10 * i))
+    for u, v in [(1, 2), (2, 3), (3, 4), (4, 5), (1, 5)]:
+        g.add_edge(u, v)
+    return g
+
+
+def test_journal_replay_matches_live_graph(tmp_path, state):
+    path = tmp_path / "graph.json"
+    g = small_graph(path)
+    g.compact_journal()
+
+    g.add_node(Node(100, "X", 0.5, 10))
+    g.add_edge(100, 1)
+    g.update_node(1, aktiflik=0.01, name="changed")
+    g.remove_edge(1, 2)
+    g.remove_node(3)
+    with g.batch():
+        g.add_edge(2, 4)
+        g.add_edge(2, 5)
+    expected = state(g)
+    g.close()
+
+    replayed = Graph(str(path), journal=True)
+    assert state(replayed) == expected
+    assert replayed.get_node_by_id(1).name == "changed"
+    assert replayed.get_node_by_id(3) is None
+
+
+def test_rolled_back_batch_is_not_journaled(tmp_path, state):
+    path = tmp_path / "graph.json"
+    g = small_graph(path)
+    expected = state(g)
+    try:
+        with g.batch():
+            g.add_edge(1, 3)
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    g.close()
+
+    assert state(Graph(str(path), journal=True)) == expected
+
+
+def test_torn_record_is_cut_off(tmp_path, state):
+    path = tmp_path / "graph.json"
+    g = small_graph(path)
+    g.close()
+    with open(str(path) + ".log", "a", encoding="utf-8") as f:
+        f.write('{"seq": 99, "op": "add_ed')
+
+    g = Graph(str(path), journal=True)
+    g.add_edge(1, 3)
+    expected = state(g)
+    g.close()
+
+    # The append after the torn record must land on a line of its own.
+    g = Graph(str(path), journal=True)
+    assert state(g) == expected
+    assert g.edge_exists(1, 3)
+
+
+def test_records_in_snapshot_are_skipped(tmp_path, state, capsys):
+    # Crash between writing the snapshot and truncating the log: the
+    # snapshot's seq must keep the old records from being applied twice.
+    path = tmp_path / "graph.json"
+    g = small_graph(path)
+    g.add_node(Node(200, "Y", 0.3, 5))
+    g.save_to_json(g.data_path)
+    expected = state(g)
+    g.close()
+
+    capsys.readouterr()
+    assert state(Graph(str(path), journal=True)) == expected
+    assert "skipped" not in capsys.readouterr().out
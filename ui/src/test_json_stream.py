@@ -0,0 +1,71 @@
+import json
+import os
+
+import pytest
+
+from ui.src import json_stream
+from ui.src.graph import Graph
+
+
+def test_pretty_output_matches_original_file(sample_graph, data_dir, tmp_path):
+    path = tmp_path / "pretty.json"
+    sample_graph.save_to_json(str(path), pretty=True)
+    with open(os.path.join(data_dir, "graph.json"), "rb") as f:
+        assert path.read_bytes() == f.read()
+
+
+def test_compact_output_is_one_element_per_line(sample_graph, data_dir, tmp_path):
+    path = tmp_path / "compact.json"
+    sample_graph.save_to_json(str(path))
+    with open(os.path.join(data_dir, "graph.json"), encoding="utf-8") as f:
+        assert json.loads(path.read_text(encoding="utf-8")) == json.load(f)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == len(sample_graph.nodes) + len(sample_graph.edges) + 3
+
+
+def test_journal_seq_is_written(tmp_path):
+    path = tmp_path / "graph.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json_stream.write_graph(f, iter(()), iter(()), journal_seq=7)
+    assert json.loads(path.read_text(encoding="utf-8")) == {"nodes": [], "edges": [], "journal_seq": 7}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 16])
+def test_streamed_parse_matches_json_load(data_dir, chunk_size):
+    path = os.path.join(data_dir, "graph.json")
+    with open(path, encoding="utf-8") as f:
+        expected = json.load(f)
+    with open(path, encoding="utf-8") as f:
+        items = list(json_stream.iter_graph(f, chunk_size))
+
+    assert [item for key, item in items if key == "nodes"] == expected["nodes"]
+    assert [item for key, item in items if key == "edges"] == expected["edges"]
+
+
+def test_streamed_parse_of_tricky_values(tmp_path):
+    doc = {"nodes": [{"id": 1, "name": 'a "b" , ] } \\u00e7 ş', "komsular": []}],
+           "edges": [], "extra": {"x": [1.5e-3, -2, True, None]}, "journal_seq": 3}
+    path = tmp_path / "g.json"
+    path.write_text(json.dumps(doc, indent=1), encoding="utf-8")
+    with open(path, encoding="utf-8") as f:
+        items = list(json_stream.iter_graph(f, chunk_size=1))
+    assert items == [("nodes", doc["nodes"][0]), ("extra", doc["extra"]), ("journal_seq", 3)]
+
+
+def test_nodes_only(sample_graph, tmp_path):
+    g = Graph(str(tmp_path / "other.json"))
+    g.load_from_json(sample_graph.data_path, nodes_only=True)
+    assert len(g.nodes) == len(sample_graph.nodes)
+    assert g.edges == []
+    assert all(n.komsular == [] for n in g.nodes)
+
+
+def test_edge_filter(sample_graph, tmp_path):
+    g = Graph(str(tmp_path / "other.json"))
+    g.load_from_json(sample_graph.data_path, edge_filter=lambda u, v, w: w >= 5)
+
+    kept = {(e.source, e.target) for e in sample_graph.edges if e.weight >= 5}
+    assert {(e.source, e.target) for e in g.edges} == kept
+    for n in g.nodes:
+        assert all(g.edge_exists(n.id, nb) for nb in n.komsular)
+        assert len(n.komsular) == sum(n.id in pair for pair in kept)
@@ -0,0 +1,43 @@
+import pytest
+
+from ui.src.algorithms.landmarks import DEGREE, FARTHEST
+
+
+@pytest.mark.parametrize("strategy", [FARTHEST, DEGREE])
+def test_landmark_astar_finds_shortest_paths(random_graph, check_paths, strategy):
+    index = random_graph.build_landmarks(k=4, strategy=strategy)
+    assert len(index.landmarks) == 4
+    check_paths(random_graph.astar)
+
+
+def test_bounds_never_overestimate(random_graph, reference_costs):
+    index = random_graph.build_landmarks(k=4)
+    csr = index.csr
+    target = 5
+    h = index.heuristic(csr, csr.index(target))
+    for node_id, cost in reference_costs(random_graph, target).items():
+        assert h(csr.index(node_id)) <= cost + 1e-9
+
+
+def test_stale_index_falls_back_until_rebuilt(random_graph, check_paths):
+    index = random_graph.build_landmarks(k=4)
+    assert random_graph.landmark_index() is index
+
+    edge = random_graph.edges[0]
+    with random_graph.batch():
+        random_graph.remove_edge(edge.source, edge.target)
+        assert random_graph.landmark_index() is None
+
+    # Not rebuilt behind the caller's back; astar() uses the default heuristic.
+    assert random_graph.landmark_index() is None
+    check_paths(random_graph.astar)
+
+    rebuilt = random_graph.build_landmarks(k=4)
+    assert rebuilt is not index
+    assert random_graph.landmark_index() is rebuilt
+
+
+def test_k_zero_switches_landmarks_off(random_graph):
+    random_graph.build_landmarks(k=4)
+    random_graph.build_landmarks(k=0)
+    assert random_graph.landmark_index() is None
@@ -0,0 +1,50 @@
+import gc
+import tracemalloc
+
+from ui.src.node import NodeStore
+
+N = 50_000
+DEGREE = 4
+
+
+def build_store():
+    store = NodeStore()
+    with store.bulk():
+        for i in range(N):
+            store.append(i + 1, f"Node {i + 1}", 0.5, 10, DEGREE,
+                         [(i + d) % N + 1 for d in (1, 2, N - 1, N - 2)])
+    return store
+
+
+def traced(fn):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        gc.collect()
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def test_store_memory_fits_five_million_nodes():
+    store, used = traced(build_store)
+    per_node = used / N
+    # A row is id + name + three numeric columns + DEGREE neighbour ids,
+    # about 110 bytes here; 5M such nodes must stay well under a GB.
+    assert per_node < 150, per_node
+    assert per_node * 5_000_000 < 1 << 30
+    assert len(store) == N
+
+
+def test_views_are_not_kept_by_the_store():
+    store = build_store()
+
+    def touch_every_row():
+        nodes = store.views()
+        assert sum(len(n.komsular) for n in nodes) == N * DEGREE
+
+    _, used = traced(touch_every_row)
+    assert used / N < 8, used / N
+    assert not store._views
@@ -0,0 +1,85 @@
+import pytest
+
+from ui.src.node import Node
+from ui.src.sqlite_store import SQLiteGraph
+
+
+def edge_state_of(edges):
+    return sorted((min(e.source, e.target), max(e.source, e.target), e.weight) for e in edges)
+
+
+@pytest.fixture
+def db(tmp_path, sample_graph):
+    g = SQLiteGraph(str(tmp_path / "graph.db"))
+    g.load(sample_graph.data_path)
+    yield g
+    g.close()
+
+
+def test_reopen_keeps_everything(tmp_path, db, sample_graph, state):
+    db.add_node(Node(100, "Yeni", 0.5, 7))
+    db.add_edge(100, 1)
+    db.remove_edge(1, 2)
+    db.update_node(3, name="changed", aktiflik=0.25)
+    expected = state(db)
+    db.close()
+
+    reopened = SQLiteGraph(str(tmp_path / "graph.db"))
+    assert state(reopened) == expected
+    assert reopened.get_node_by_id(3).name == "changed"
+    assert reopened.neighbors(100) == [1]
+    assert not reopened.edge_exists(1, 2)
+    reopened.close()
+
+
+def test_loaded_graph_matches_json(db, sample_graph, state):
+    assert state(db) == state(sample_graph)
+
+
+def test_batch_rolls_back(db, state):
+    before = state(db)
+    with pytest.raises(RuntimeError):
+        with db.batch():
+            db.add_node(Node(100, "X", 0.5, 10))
+            db.add_edge(100, 1)
+            db.update_node(1, aktiflik=0.9)
+            db.remove_node(2)
+            raise RuntimeError
+    assert state(db) == before
+    assert db.get_node_by_id(100) is None
+
+
+def test_update_node_matches_graph(db, sample_graph, state):
+    changed = db.update_node(1, aktiflik=0.1, etkilesim=3)
+    expected = sample_graph.update_node(1, aktiflik=0.1, etkilesim=3)
+    assert edge_state_of(changed) == edge_state_of(expected)
+    assert state(db) == state(sample_graph)
+
+
+def test_apply_delta_matches_graph(db, sample_graph, state):
+    delta = {
+        "remove_edges": [[1, 2]],
+        "remove_nodes": [5],
+        "add_nodes": [{"id": 100, "aktiflik": 0.5, "etkilesim": 3}],
+        "update_nodes": [{"id": 3, "aktiflik": 0.9}],
+        "add_edges": [[100, 3], [1, 3]],
+    }
+    changed = db.apply_delta(delta)
+    expected = sample_graph.apply_delta(delta)
+    # One Edge per pair, with the same weights as Graph.
+    assert len({(e.source, e.target) for e in changed}) == len(changed)
+    assert edge_state_of(changed) == edge_state_of(expected)
+    assert state(db) == state(sample_graph)
+
+
+def test_dijkstra_matches_graph(db, sample_graph):
+    ids = [n.id for n in sample_graph.nodes]
+    for end in ids[1:]:
+        try:
+            expected = sample_graph.dijkstra(ids[0], end)
+        except ValueError:
+            with pytest.raises(ValueError):
+                db.dijkstra(ids[0], end)
+            continue
+        assert db.dijkstra(ids[0], end) == expected
+
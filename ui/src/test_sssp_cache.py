@@ -0,0 +1,62 @@
+import pytest
+
+from ui.src.algorithms.sssp_cache import BYTES_PER_NODE
+
+
+def test_cached_dijkstra_finds_shortest_paths(random_graph, check_paths):
+    check_paths(random_graph.dijkstra)
+
+
+def test_same_source_hits_the_cache(random_graph):
+    cache = random_graph.sssp_cache
+    ends = [n.id for n in random_graph.nodes][1:20]
+    for end in ends:
+        try:
+            random_graph.dijkstra(0, end)
+        except ValueError:
+            pass
+    assert (cache.misses, cache.hits) == (1, len(ends) - 1)
+    assert len(cache) == 1
+
+
+def test_mutation_invalidates_trees(random_graph):
+    edge = random_graph.edges[0]
+    random_graph.dijkstra(edge.source, edge.target)
+    random_graph.remove_edge(edge.source, edge.target)
+    misses = random_graph.sssp_cache.misses
+    try:
+        path, _ = random_graph.dijkstra(edge.source, edge.target)
+        assert len(path) > 2
+    except ValueError:
+        pass
+    assert random_graph.sssp_cache.misses == misses + 1
+    assert len(random_graph.sssp_cache) == 1
+
+
+def test_lru_stays_within_budget(random_graph):
+    cache = random_graph.sssp_cache
+    cache.max_bytes = 3 * BYTES_PER_NODE * len(random_graph.nodes)
+    for start in range(10):
+        random_graph.dijkstra(start, start)
+    assert len(cache) == 3
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_uncached_search_when_a_tree_does_not_fit(random_graph, query_pairs):
+    pairs = [(s, e) for s, e in query_pairs if s != e]
+    cached = {}
+    for pair in pairs:
+        try:
+            cached[pair] = random_graph.dijkstra(*pair)[1]
+        except ValueError:
+            cached[pair] = None
+
+    random_graph.sssp_cache.max_bytes = 0  # no tree fits: early-exit search
+    misses = random_graph.sssp_cache.misses
+    for pair in pairs:
+        try:
+            cost = random_graph.dijkstra(*pair)[1]
+        except ValueError:
+            cost = None
+        assert cost == pytest.approx(cached[pair])
+    assert random_graph.sssp_cache.misses == misses